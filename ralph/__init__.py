@@ -16,42 +16,58 @@ Key components:
 
 __version__ = "2.0.0"
 
-from .core import (
+import importlib
+from typing import List
+
+# Public name -> submodule that defines it. Submodules are imported on first
+# attribute access, so entry points that only need one corner of the package
+# (hook scripts, `ralph --help`) don't load the orchestrator and agents.
+_LAZY_EXPORTS = {
     # Phase
-    Phase,
-    can_transition,
-    is_approval_phase,
+    "Phase": ".core",
+    "can_transition": ".core",
+    "is_approval_phase": ".core",
     # Spec
-    Spec,
-    TechStack,
-    Constraints,
-    create_spec,
+    "Spec": ".core",
+    "TechStack": ".core",
+    "Constraints": ".core",
+    "create_spec": ".core",
     # Message
-    Message,
-    MessageType,
+    "Message": ".core",
+    "MessageType": ".core",
     # Errors
-    ErrorReport,
-    RalphError,
-)
+    "ErrorReport": ".core",
+    "RalphError": ".core",
+    # Orchestrator
+    "Orchestrator": ".orchestrator",
+    "PipelineConfig": ".orchestrator",
+    "PipelineStatus": ".orchestrator",
+    "init_orchestrator": ".orchestrator",
+    "get_orchestrator": ".orchestrator",
+    # Agents
+    "AgentRole": ".agents",
+    "Team": ".agents",
+    "AgentInvoker": ".agents",
+    # Tools
+    "ToolRegistry": ".tools",
+    "get_tool_registry": ".tools",
+}
+
+
+def __getattr__(name: str):
+    """Import the public name from its submodule on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
 
-from .orchestrator import (
-    Orchestrator,
-    PipelineConfig,
-    PipelineStatus,
-    init_orchestrator,
-    get_orchestrator,
-)
 
-from .agents import (
-    AgentRole,
-    Team,
-    AgentInvoker,
-)
+def __dir__() -> List[str]:
+    """Include the lazily exported names."""
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
-from .tools import (
-    ToolRegistry,
-    get_tool_registry,
-)
 
 __all__ = [
     # Version
@@ -12,6 +12,7 @@ from .roles import (
     get_team_roles,
     get_role_team,
     load_system_prompt,
+    clear_prompt_cache,
 )
 
 from .context import (
@@ -38,6 +39,7 @@ __all__ = [
     "get_team_roles",
     "get_role_team",
     "load_system_prompt",
+    "clear_prompt_cache",
     # Context
     "AgentContext",
     "SiblingStatus",
@@ -12,8 +12,8 @@ The AgentContext contains everything an agent needs to do its job:
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from pathlib import Path
-import json
 
+from ..core.jsonio import dumps, loads, write_json_atomic
 from ..core.spec import Spec, TechStack
 from ..core.message import Message
 from ..core.errors import ErrorReport
@@ -21,7 +21,7 @@ from ..core.phase import Phase
 from .roles import AgentRole, get_role_config
 
 
-@dataclass
+@dataclass(slots=True)
 class SiblingStatus:
     """Status of a sibling spec."""
     name: str
@@ -36,7 +36,7 @@ class SiblingStatus:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentContext:
     """
     Context provided to an agent when invoked.
@@ -132,7 +132,7 @@ class AgentContext:
     
     def to_json(self) -> str:
         """Serialize to JSON string."""
-        return json.dumps(self.to_dict())
+        return dumps(self.to_dict())
     
     @classmethod
     def from_dict(cls, data: dict) -> "AgentContext":
@@ -172,7 +172,21 @@ class AgentContext:
     @classmethod
     def from_json(cls, json_str: str) -> "AgentContext":
         """Create from JSON string."""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(loads(json_str))
+
+
+# Only the most recent error reports are shown to a retrying agent
+_ERROR_CONTEXT_WINDOW = 10
+
+
+def _recent_errors(errors: List[ErrorReport]) -> List[Dict]:
+    """
+    Serialize the last few error reports.
+    
+    Long retry loops accumulate many reports; older ones only add tokens,
+    so just the most recent window is passed to the agent.
+    """
+    return [err.to_dict() for err in errors[-_ERROR_CONTEXT_WINDOW:]]
 
 
 def build_agent_context(
@@ -186,6 +200,7 @@ def build_agent_context(
     tool_config: Optional[Dict] = None,
     siblings: Optional[List[Spec]] = None,
     parent_spec: Optional[Spec] = None,
+    payload_dir: Optional[Path] = None,
 ) -> AgentContext:
     """
     Build an AgentContext from a spec and configuration.
@@ -201,6 +216,8 @@ def build_agent_context(
         tool_config: Tool configuration from registry
         siblings: Sibling specs (for coordination)
         parent_spec: Parent spec (for context)
+        payload_dir: Directory for bulky message payloads; the prompt shows a
+            preview and the file path. Without it payloads are shown in full.
         
     Returns:
         AgentContext ready for serialization
@@ -252,78 +269,94 @@ def build_agent_context(
         build_command=tool_config.get("build_command", ""),
         test_command=tool_config.get("test_command", ""),
         lint_command=tool_config.get("lint_command", ""),
-        pending_messages=[m.to_dict() for m in (pending_messages or [])],
-        previous_errors=[e.to_dict() for e in (previous_errors or [])],
+        pending_messages=_message_dicts(pending_messages or [], payload_dir),
+        previous_errors=_recent_errors(previous_errors or []),
         sibling_status=sibling_status,
         parent_spec=parent_dict,
     )
 
 
+# Pending message payloads longer than this are written to a file, and the
+# prompt shows only a preview and the file's path
+_PAYLOAD_INLINE_CHARS = 2000
+_PAYLOAD_PREVIEW_CHARS = 200
+
+
+def _message_dicts(messages: List[Message], payload_dir: Optional[Path]) -> List[Dict]:
+    """Serialize pending messages, spilling bulky payloads to payload_dir."""
+    result = []
+    for message in messages:
+        data = message.to_dict()
+        if payload_dir is not None and data.get("payload"):
+            if len(dumps(data["payload"])) > _PAYLOAD_INLINE_CHARS:
+                payload_file = payload_dir / f"{message.id}.payload.json"
+                if not payload_file.exists():
+                    payload_dir.mkdir(parents=True, exist_ok=True)
+                    write_json_atomic(payload_file, data["payload"], indent=2)
+                data["payload_file"] = str(payload_file)
+        result.append(data)
+    return result
+
+
+def _render_payload(msg: Dict) -> str:
+    """Render a message payload for the prompt, previewing spilled payloads."""
+    payload = msg.get("payload", {})
+    if not payload:
+        return "{}"
+    # Compact separators: the agent only needs to parse it, and it halves the tokens
+    text = dumps(payload)
+    payload_file = msg.get("payload_file")
+    if not payload_file:
+        return text
+    return (
+        f"{text[:_PAYLOAD_PREVIEW_CHARS]}\n"
+        f"  ... ({len(text)} chars total; read the full payload from {payload_file})"
+    )
+
+
 def build_initial_prompt(context: AgentContext) -> str:
     """
     Build the initial prompt for an agent from its context.
     
-    This is what the agent sees when it starts.
+    This is what the agent sees when it starts. Sections that stay the same
+    across iterations come first and the per-iteration state (phase,
+    iteration, messages, errors) comes last, so consecutive prompts for the
+    same spec share as long a prefix as possible for provider prompt caching.
     """
+    return _build_stable_prefix(context) + "\n" + _build_volatile_suffix(context)
+
+
+def _build_stable_prefix(context: AgentContext) -> str:
+    """Build the prompt sections that only change when the spec does."""
     lines = [
         f"# Task: {context.spec_name}",
         "",
         f"**Role:** {context.role.value}",
-        f"**Phase:** {context.current_phase.value}",
-        f"**Iteration:** {context.iteration}/{context.max_iterations}",
-        "",
-        "## Problem",
-        context.problem,
         "",
+    ]
+    
+    # The verifier checks the work against the success criteria, so it
+    # skips only the problem statement and background prose
+    if context.role != AgentRole.VERIFIER:
+        lines.extend([
+            "## Problem",
+            context.problem,
+            "",
+        ])
+    
+    lines.extend([
         "## Success Criteria",
         context.success_criteria,
         "",
-    ]
+    ])
     
-    if context.context_info:
+    if context.context_info and context.role != AgentRole.VERIFIER:
         lines.extend([
             "## Additional Context",
             context.context_info,
             "",
         ])
     
-    # Show pending messages
-    if context.pending_messages:
-        lines.append("## Pending Messages")
-        lines.append("")
-        for msg in context.pending_messages:
-            lines.append(f"- **{msg.get('type', 'unknown')}** from {msg.get('from_id', 'unknown')}:")
-            lines.append(f"  {json.dumps(msg.get('payload', {}), indent=2)}")
-        lines.append("")
-    
-    # Show previous errors (for retry)
-    if context.previous_errors:
-        lines.append("## Previous Errors (Fix These!)")
-        lines.append("")
-        for err in context.previous_errors:
-            lines.append(f"### Iteration {err.get('iteration', '?')}")
-            lines.append(f"**{err.get('category', 'error')}:** {err.get('message', 'Unknown error')}")
-            
-            if err.get("compilation") and not err["compilation"].get("success", True):
-                lines.append("")
-                lines.append("**Compilation Errors:**")
-                for ce in err["compilation"].get("errors", [])[:5]:
-                    if isinstance(ce, dict):
-                        lines.append(f"- {ce.get('file', '')}:{ce.get('line', '')}: {ce.get('message', '')}")
-                    else:
-                        lines.append(f"- {ce}")
-            
-            if err.get("tests") and err["tests"].get("failures"):
-                lines.append("")
-                lines.append("**Test Failures:**")
-                for tf in err["tests"]["failures"][:5]:
-                    if isinstance(tf, dict):
-                        lines.append(f"- {tf.get('test_name', 'unknown')}: {tf.get('message', '')}")
-                    else:
-                        lines.append(f"- {tf}")
-            
-            lines.append("")
-    
     # Show structure for implementer
     if context.role == AgentRole.IMPLEMENTER and context.classes:
         lines.append("## Files to Create/Modify")
@@ -362,3 +395,52 @@ def build_initial_prompt(context: AgentContext) -> str:
     lines.append("")
     
     return "\n".join(lines)
+
+
+def _build_volatile_suffix(context: AgentContext) -> str:
+    """Build the prompt sections that change between iterations."""
+    lines = [
+        "## Current State",
+        f"**Phase:** {context.current_phase.value}",
+        f"**Iteration:** {context.iteration}/{context.max_iterations}",
+        "",
+    ]
+    
+    # Show pending messages
+    if context.pending_messages:
+        lines.append("## Pending Messages")
+        lines.append("")
+        for msg in context.pending_messages:
+            lines.append(f"- **{msg.get('type', 'unknown')}** from {msg.get('from_id', 'unknown')}:")
+            lines.append(f"  {_render_payload(msg)}")
+        lines.append("")
+    
+    # Show previous errors (for retry)
+    if context.previous_errors:
+        lines.append("## Previous Errors (Fix These!)")
+        lines.append("")
+        for err in context.previous_errors:
+            lines.append(f"### Iteration {err.get('iteration', '?')}")
+            lines.append(f"**{err.get('category', 'error')}:** {err.get('message', 'Unknown error')}")
+            
+            if err.get("compilation") and not err["compilation"].get("success", True):
+                lines.append("")
+                lines.append("**Compilation Errors:**")
+                for ce in err["compilation"].get("errors", [])[:5]:
+                    if isinstance(ce, dict):
+                        lines.append(f"- {ce.get('file', '')}:{ce.get('line', '')}: {ce.get('message', '')}")
+                    else:
+                        lines.append(f"- {ce}")
+            
+            if err.get("tests") and err["tests"].get("failures"):
+                lines.append("")
+                lines.append("**Test Failures:**")
+                for tf in err["tests"]["failures"][:5]:
+                    if isinstance(tf, dict):
+                        lines.append(f"- {tf.get('test_name', 'unknown')}: {tf.get('message', '')}")
+                    else:
+                        lines.append(f"- {tf}")
+            
+            lines.append("")
+    
+    return "\n".join(lines)
@@ -6,7 +6,7 @@ configuration, tool access, and MCP servers.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from pathlib import Path
 from datetime import datetime, timezone
 import asyncio
@@ -15,9 +15,27 @@ from ..core.spec import Spec, TechStack
 from ..core.message import Message, create_phase_complete_message
 from ..core.errors import ErrorReport
 from ..tools.registry import get_tool_registry
-from .context import AgentContext, build_agent_context, build_initial_prompt
+from .context import build_agent_context, build_initial_prompt
 from .roles import AgentRole, load_system_prompt
 
+# Import the Agent SDK once at load time rather than on every invocation
+try:
+    from claude_agent_sdk import (
+        ClaudeSDKClient,
+        ClaudeAgentOptions,
+        AssistantMessage,
+        ResultMessage,
+        TextBlock,
+        ToolUseBlock,
+        CLINotFoundError,
+        ProcessError,
+        CLIJSONDecodeError,
+    )
+    from ..hooks.sdk_hooks import create_ralph_hooks
+    HAS_CLAUDE_AGENT_SDK = True
+except ImportError:
+    HAS_CLAUDE_AGENT_SDK = False
+
 
 @dataclass
 class AgentResult:
@@ -31,6 +49,9 @@ class AgentResult:
     duration_ms: int = 0
     cost_usd: Optional[float] = None
     session_id: Optional[str] = None
+    # Token usage reported by the SDK, including cache_read_input_tokens and
+    # cache_creation_input_tokens when prompt caching applied
+    usage: Optional[Dict[str, Any]] = None
     
     def to_dict(self) -> dict:
         return {
@@ -42,6 +63,7 @@ class AgentResult:
             "duration_ms": self.duration_ms,
             "cost_usd": self.cost_usd,
             "session_id": self.session_id,
+            "usage": self.usage,
         }
 
 
@@ -75,12 +97,19 @@ class AgentInvoker:
         """
         self.project_root = project_root
         self.prompts_dir = prompts_dir or project_root / ".ralph" / "prompts"
+        self.state_dir = project_root / ".ralph" / "state"
+        self._cwd = str(project_root)
         self.dry_run = dry_run
         self.permission_mode = permission_mode
         self.tool_registry = get_tool_registry()
 
         self._artifact_tracker: Dict[str, List[str]] = {}
         self._session_cache: Dict[str, str] = {}  # spec_id -> session_id
+        # (role, language, extra MCP) -> (tool_config, SDK mcp config, all tool names)
+        self._tool_setups: Dict[
+            Tuple[str, str, Tuple[str, ...]],
+            Tuple[Dict[str, Any], Dict[str, Dict[str, Any]], List[str]],
+        ] = {}
     
     async def invoke(
         self,
@@ -115,14 +144,18 @@ class AgentInvoker:
         """
         start_time = datetime.now(timezone.utc)
         
+        self._artifact_tracker[spec.id] = []
+        
+        # Nothing is sent in a dry run, so skip building tools, context and prompts
+        if self.dry_run:
+            return self._dry_run_result(role, spec)
+        
         tech_stack = tech_stack or spec.get_effective_tech_stack()
         language = tech_stack.language.lower() if tech_stack else "python"
         
         # Get tools for this role
-        tool_config = self.tool_registry.get_tools_for_role(
-            role=role.value,
-            tech_stack=language,
-            additional_mcp=tech_stack.mcp_tools if tech_stack else None,
+        tool_config, mcp_config, all_tools = self._get_tool_setup(
+            role, language, tech_stack.mcp_tools if tech_stack else None,
         )
         
         # Build agent context and prompts
@@ -136,15 +169,11 @@ class AgentInvoker:
             tool_config=tool_config,
             siblings=siblings,
             parent_spec=parent_spec,
+            payload_dir=self.state_dir / "messages",
         )
         
         system_prompt = load_system_prompt(role, self.prompts_dir)
         initial_prompt = build_initial_prompt(context)
-        
-        self._artifact_tracker[spec.id] = []
-        
-        if self.dry_run:
-            return self._dry_run_result(role, spec, context)
 
         # Determine if we should resume a previous session
         session_id: Optional[str] = None
@@ -155,8 +184,8 @@ class AgentInvoker:
         result = await self._invoke_with_sdk(
             prompt=initial_prompt,
             system_prompt=system_prompt,
-            tools=tool_config.get("allowed_tools", []),
-            mcp_servers=tool_config.get("mcp_servers", {}),
+            tools=all_tools,
+            mcp_config=mcp_config,
             timeout=timeout,
             session_id=session_id,
             allowed_paths=context.allowed_paths,
@@ -178,12 +207,60 @@ class AgentInvoker:
 
         return result
     
+    def _get_tool_setup(
+        self,
+        role: AgentRole,
+        language: str,
+        additional_mcp: Optional[List[str]] = None,
+    ) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]], List[str]]:
+        """
+        Get the tool configuration for a role, built once per combination.
+        
+        Returns:
+            Tuple of (registry tool_config, SDK-format MCP server config,
+            builtin + MCP tool names)
+        """
+        key = (role.value, language, tuple(additional_mcp or ()))
+        setup = self._tool_setups.get(key)
+        if setup is not None:
+            return setup
+        
+        tool_config = self.tool_registry.get_tools_for_role(
+            role=role.value,
+            tech_stack=language,
+            additional_mcp=additional_mcp,
+        )
+        
+        # mcp_servers is already in SDK format: {name: {command, args, env?}}
+        # Add "type": "stdio" for external process servers
+        mcp_config: Dict[str, Dict[str, Any]] = {}
+        mcp_tool_names: List[str] = []
+        
+        for server_name, server_config in tool_config.get("mcp_servers", {}).items():
+            mcp_config[server_name] = {
+                "type": "stdio",  # External process servers
+                "command": server_config.get("command", ""),
+                "args": server_config.get("args", []),
+            }
+            if server_config.get("env"):
+                mcp_config[server_name]["env"] = server_config["env"]
+            
+            # Tools already have full MCP names (mcp__{server}__{tool})
+            mcp_tool_names.extend(server_config.get("tools", []))
+        
+        # Combine builtin tools with MCP tools
+        all_tools = list(tool_config.get("allowed_tools", [])) + mcp_tool_names
+        
+        setup = (tool_config, mcp_config, all_tools)
+        self._tool_setups[key] = setup
+        return setup
+    
     async def _invoke_with_sdk(
         self,
         prompt: str,
         system_prompt: str,
-        tools: List[str],
-        mcp_servers: Dict[str, Dict[str, Any]],
+        tools: List[str],  # builtin + MCP tool names
+        mcp_config: Dict[str, Dict[str, Any]],
         timeout: float,
         session_id: Optional[str] = None,
         allowed_paths: Optional[List[str]] = None,
@@ -198,45 +275,13 @@ class AgentInvoker:
         as the agent works. Supports hooks for scope enforcement and
         cross-agent communication.
         """
-        try:
-            from claude_agent_sdk import (
-                ClaudeSDKClient,
-                ClaudeAgentOptions,
-                AssistantMessage,
-                ResultMessage,
-                CLINotFoundError,
-                ProcessError,
-                CLIJSONDecodeError,
-            )
-        except ImportError:
+        if not HAS_CLAUDE_AGENT_SDK:
             return AgentResult(
                 success=False,
                 output="",
                 error="claude-agent-sdk not installed. Run: pip install claude-agent-sdk",
             )
 
-        from ..hooks.sdk_hooks import create_ralph_hooks
-
-        # mcp_servers is already in SDK format: {name: {command, args, env?}}
-        # Add "type": "stdio" for external process servers
-        mcp_config: Dict[str, Dict[str, Any]] = {}
-        mcp_tool_names: List[str] = []
-
-        for server_name, server_config in mcp_servers.items():
-            mcp_config[server_name] = {
-                "type": "stdio",  # External process servers
-                "command": server_config.get("command", ""),
-                "args": server_config.get("args", []),
-            }
-            if server_config.get("env"):
-                mcp_config[server_name]["env"] = server_config["env"]
-
-            # Tools already have full MCP names (mcp__{server}__{tool})
-            mcp_tool_names.extend(server_config.get("tools", []))
-
-        # Combine builtin tools with MCP tools
-        all_tools = list(tools) + mcp_tool_names
-
         # Get or create artifact tracker for this spec
         artifact_list = self._artifact_tracker.get(spec_id, []) if spec_id else []
 
@@ -244,17 +289,17 @@ class AgentInvoker:
         hooks = create_ralph_hooks(
             allowed_paths=allowed_paths or [],
             forbidden_paths=forbidden_paths or [],
-            allowed_tools=all_tools,
+            allowed_tools=tools,
             artifact_tracker=artifact_list,
-            state_dir=self.project_root / ".ralph" / "state",
+            state_dir=self.state_dir,
         )
 
         # Build options
         options = ClaudeAgentOptions(
-            allowed_tools=all_tools,
+            allowed_tools=tools,
             system_prompt=system_prompt,
             permission_mode=self.permission_mode,
-            cwd=str(self.project_root),
+            cwd=self._cwd,
             mcp_servers=mcp_config if mcp_config else None,
             resume=session_id,
             hooks=hooks,
@@ -283,14 +328,13 @@ class AgentInvoker:
 
                         if isinstance(message, AssistantMessage):
                             for block in message.content:
-                                block_type = getattr(block, "type", None)
-                                if block_type == "text":
+                                if isinstance(block, TextBlock):
                                     output_parts.append(block.text)
-                                elif block_type == "tool_use":
+                                elif isinstance(block, ToolUseBlock):
                                     output_parts.append(f"[Tool: {block.name}]")
                                     # Track file artifacts
                                     if block.name in ("Write", "Edit"):
-                                        file_path = getattr(block, "input", {}).get("file_path")
+                                        file_path = block.input.get("file_path")
                                         if file_path:
                                             artifacts.append(file_path)
 
@@ -301,6 +345,7 @@ class AgentInvoker:
                                 "is_error": message.is_error,
                                 "session_id": message.session_id,
                                 "cost_usd": getattr(message, "total_cost_usd", None),
+                                "usage": getattr(message, "usage", None),
                             }
 
             success = not result_info.get("is_error", False)
@@ -315,6 +360,7 @@ class AgentInvoker:
                 duration_ms=result_info.get("duration_ms", 0),
                 cost_usd=result_info.get("cost_usd"),
                 session_id=final_session_id,
+                usage=result_info.get("usage"),
                 error=None if success else "Agent reported error",
             )
 
@@ -367,7 +413,6 @@ class AgentInvoker:
         self,
         role: AgentRole,
         spec: Spec,
-        context: AgentContext,
     ) -> AgentResult:
         """Return a dry-run result without invoking agent."""
         return AgentResult(
@@ -377,7 +422,7 @@ class AgentInvoker:
             messages=[
                 create_phase_complete_message(
                     spec.id,
-                    context.current_phase.value,
+                    spec.phase.value,
                     success=True,
                     summary="Dry run completed",
                 )
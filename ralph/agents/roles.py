@@ -5,9 +5,15 @@ Each role has specific responsibilities, allowed tools, and system prompts.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Optional
+from typing import Dict, List, Set, Optional, Tuple
 from enum import Enum
 from pathlib import Path
+import hashlib
+import logging
+import os
+
+# Library code must not print: under the MCP stdio server stdout is the protocol
+logger = logging.getLogger(__name__)
 
 
 class AgentRole(str, Enum):
@@ -173,21 +179,53 @@ def get_role_team(role: AgentRole) -> Team:
 # SYSTEM PROMPTS
 # =============================================================================
 
+# Loaded prompt files: path -> (mtime_ns, size, content digest, text)
+_prompt_cache: Dict[str, Tuple[int, int, str, str]] = {}
+
+
 def load_system_prompt(role: AgentRole, prompts_dir: Optional[Path] = None) -> str:
     """
     Load the system prompt for a role.
     
     Looks for {role.value}.md in prompts_dir, falls back to default.
+    Prompt files are cached and only re-read when their mtime or size
+    changes, so each call costs a single stat. A re-read whose content
+    hashes the same as before (an editor touch, a no-op save) keeps the
+    cached text, so only real edits change the system prompt.
     """
     if prompts_dir:
         prompt_file = prompts_dir / f"{role.value}.md"
-        if prompt_file.exists():
-            return prompt_file.read_text(encoding="utf-8")
+        try:
+            stat = os.stat(prompt_file)
+        except FileNotFoundError:
+            stat = None
+        
+        if stat is not None:
+            key = str(prompt_file)
+            cached = _prompt_cache.get(key)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                return cached[3]
+            
+            raw = prompt_file.read_bytes()
+            digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+            if cached and cached[2] == digest:
+                prompt = cached[3]
+            else:
+                if cached:
+                    logger.warning("System prompt changed on disk: %s", prompt_file)
+                prompt = raw.decode("utf-8")
+            _prompt_cache[key] = (stat.st_mtime_ns, stat.st_size, digest, prompt)
+            return prompt
     
     # Fall back to built-in prompts
     return DEFAULT_PROMPTS.get(role, f"You are the {role.value} agent.")
 
 
+def clear_prompt_cache() -> None:
+    """Clear cached prompt files (for testing)."""
+    _prompt_cache.clear()
+
+
 # Default prompts (used if no file found)
 DEFAULT_PROMPTS: Dict[AgentRole, str] = {
     AgentRole.SPEC_WRITER: """# Spec Writer
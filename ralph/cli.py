@@ -3,12 +3,12 @@ Command line interface for the Ralph pipeline.
 """
 
 import argparse
-import asyncio
 import json
 import sys
 from pathlib import Path
 from typing import Optional
 
+from .core import eventloop
 
 def cmd_init(args: argparse.Namespace) -> int:
     """Initialize a new Ralph project."""
@@ -80,9 +80,10 @@ def cmd_start(args: argparse.Namespace) -> int:
     
     async def run():
         spec_id = await orchestrator.submit_spec(spec_data)
+        await orchestrator.message_bus.flush()
         print(f"Submitted spec: {spec_id}")
     
-    asyncio.run(run())
+    eventloop.run(run())
     return 0
 
 
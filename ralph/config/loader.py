@@ -13,7 +13,7 @@ from dataclasses import dataclass, field
 from .defaults import FORBIDDEN_TOOLS
 
 
-@dataclass
+@dataclass(slots=True)
 class MergedConfig:
     """Merged configuration from defaults and project overrides."""
     tech_stack: str
@@ -84,10 +84,11 @@ def load_project_config(project_root: Path) -> Optional[Dict[str, Any]]:
         Dict containing the parsed config, or None if no config file exists.
     """
     config_path = project_root / "ralph.config.json"
-    if config_path.exists():
+    try:
         with open(config_path, encoding="utf-8") as f:
             return json.load(f)
-    return None
+    except FileNotFoundError:
+        return None
 
 
 def _deep_copy_dict(d: Dict[str, Any]) -> Dict[str, Any]:
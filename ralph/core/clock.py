@@ -0,0 +1,30 @@
+"""
+Timestamp helpers for the Ralph pipeline.
+
+Specs, messages, transitions and audit logs are all stamped with UTC
+ISO-8601 strings. Building a timezone-aware datetime for each stamp is
+comparatively slow, so the formatted date/time prefix is cached per
+second and only the microseconds are formatted per call.
+"""
+
+import time
+from typing import Tuple
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS" prefix) for the last call
+_cached_second: Tuple[int, str] = (-1, "")
+
+
+def utc_now_iso() -> str:
+    """
+    Get the current UTC time as an ISO-8601 string.
+
+    Matches datetime.now(timezone.utc).isoformat() output, e.g.
+    "2025-01-31T12:34:56.789012+00:00" (microseconds always included).
+    """
+    global _cached_second
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached = _cached_second
+    if cached[0] != seconds:
+        cached = (seconds, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds)))
+        _cached_second = cached
+    return f"{cached[1]}.{nanos // 1000:06d}+00:00"
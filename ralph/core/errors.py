@@ -10,7 +10,8 @@ Defines structured error types that can be:
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from enum import Enum
-from datetime import datetime, timezone
+
+from .clock import utc_now_iso
 
 
 class ErrorCategory(str, Enum):
@@ -180,7 +181,7 @@ class VerificationResults:
     """Combined verification results (compilation + tests)."""
     iteration: int
     timestamp: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
+        default_factory=utc_now_iso
     )
     compilation: Optional[CompilationResults] = None
     tests: Optional[TestResults] = None
@@ -221,7 +222,7 @@ class VerificationResults:
     def from_dict(cls, data: dict) -> "VerificationResults":
         return cls(
             iteration=data.get("iteration", 0),
-            timestamp=data.get("timestamp", datetime.now(timezone.utc).isoformat()),
+            timestamp=data.get("timestamp") or utc_now_iso(),
             compilation=CompilationResults.from_dict(data["compilation"]) if data.get("compilation") else None,
             tests=TestResults.from_dict(data["tests"]) if data.get("tests") else None,
             lint_passed=data.get("lint_passed"),
@@ -242,7 +243,7 @@ class ErrorReport:
     severity: ErrorSeverity
     message: str
     timestamp: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
+        default_factory=utc_now_iso
     )
     compilation: Optional[CompilationResults] = None
     tests: Optional[TestResults] = None
@@ -269,7 +270,7 @@ class ErrorReport:
             category=ErrorCategory(data.get("category", "agent")),
             severity=ErrorSeverity(data.get("severity", "error")),
             message=data.get("message", ""),
-            timestamp=data.get("timestamp", datetime.now(timezone.utc).isoformat()),
+            timestamp=data.get("timestamp") or utc_now_iso(),
             compilation=CompilationResults.from_dict(data["compilation"]) if data.get("compilation") else None,
             tests=TestResults.from_dict(data["tests"]) if data.get("tests") else None,
             details=data.get("details", {}),
@@ -0,0 +1,34 @@
+"""
+Event loop setup for the Ralph pipeline.
+
+uvloop is an optional speedup for the event loop (pip install
+ralph-pipeline[fast], POSIX only); the stdlib loop is the fallback.
+"""
+
+from typing import Any, Coroutine
+import asyncio
+import sys
+
+try:
+    import uvloop
+    HAS_UVLOOP = sys.platform != "win32"
+except ImportError:
+    HAS_UVLOOP = False
+
+
+def run(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine on uvloop when available, else the stdlib loop."""
+    if HAS_UVLOOP:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+def install_event_loop_policy() -> None:
+    """
+    Make loops created from here on uvloop loops, when available.
+
+    For code that creates its own loop (e.g. FastMCP's run) instead of
+    taking a coroutine.
+    """
+    if HAS_UVLOOP:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -0,0 +1,115 @@
+"""
+JSON persistence helpers for the Ralph pipeline.
+
+Spec files and message bus state are read by several processes (the
+orchestrator, the MCP server, hook scripts), so writes go through a
+temporary file and an atomic rename. A reader never observes a
+half-written file.
+
+orjson is used when installed (pip install ralph-pipeline[fast]); the
+stdlib json module is the fallback.
+"""
+
+from pathlib import Path
+from typing import Any, Optional, Union
+import json
+import os
+import sys
+import threading
+import time
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dumps_bytes(data: Any, indent: Optional[int] = None) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON bytes.
+
+    Args:
+        data: JSON-serializable data
+        indent: Indentation for human-readable output (None for compact;
+            orjson only supports 2)
+
+    Returns:
+        Encoded JSON document
+    """
+    if HAS_ORJSON and indent in (None, 2):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+        except orjson.JSONEncodeError:
+            pass  # e.g. non-str keys or huge ints; let stdlib handle it
+
+    if indent is None:
+        text = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    else:
+        text = json.dumps(data, indent=indent, ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+def dumps(data: Any, indent: Optional[int] = None) -> str:
+    """Serialize data to a JSON string (compact unless indent is given)."""
+    return dumps_bytes(data, indent).decode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document from bytes or str."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(path: Path) -> Any:
+    """Read and parse a JSON file."""
+    return loads(path.read_bytes())
+
+
+def write_bytes_atomic(path: Path, payload: bytes) -> None:
+    """
+    Write bytes to path atomically.
+
+    The payload is written to a sibling temp file with a single os.write
+    and then renamed over the target. The temp name is unique per process
+    and thread so concurrent writers never share it. If anything fails the
+    temp file is removed and the error re-raised.
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            view = memoryview(payload)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
+        _replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+# On Windows a rename over a file another process has open fails with
+# PermissionError until that reader closes it, so retry briefly
+_REPLACE_ATTEMPTS = 5 if sys.platform == "win32" else 1
+_REPLACE_RETRY_DELAY = 0.05
+
+
+def _replace(src: Path, dst: Path) -> None:
+    """os.replace, retried on Windows while the target is held open."""
+    for attempt in range(_REPLACE_ATTEMPTS):
+        try:
+            os.replace(src, dst)
+            return
+        except PermissionError:
+            if attempt == _REPLACE_ATTEMPTS - 1:
+                raise
+            time.sleep(_REPLACE_RETRY_DELAY * (attempt + 1))
+
+
+def write_json_atomic(path: Path, data: Any, indent: Optional[int] = None) -> None:
+    """Serialize data and write it to path atomically."""
+    write_bytes_atomic(path, dumps_bytes(data, indent=indent))
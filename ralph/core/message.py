@@ -11,9 +11,10 @@ Messages flow through the MessageBus and are the primary mechanism for:
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, List
 from enum import Enum
-from datetime import datetime, timezone
 import uuid
 
+from .clock import utc_now_iso
+
 
 class MessageType(str, Enum):
     """Types of messages in the system."""
@@ -83,7 +84,7 @@ class Message:
     
     # Timestamps
     created_at: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
+        default_factory=utc_now_iso
     )
     delivered_at: Optional[str] = None
     processed_at: Optional[str] = None
@@ -122,22 +123,22 @@ class Message:
             payload=data.get("payload", {}),
             priority=MessagePriority(data.get("priority", "normal")),
             status=MessageStatus(data.get("status", "pending")),
-            created_at=data.get("created_at", datetime.now(timezone.utc).isoformat()),
+            created_at=data.get("created_at") or utc_now_iso(),
             delivered_at=data.get("delivered_at"),
             processed_at=data.get("processed_at"),
             reply_to=data.get("reply_to"),
             expects_reply=data.get("expects_reply", False),
         )
     
-    def mark_delivered(self) -> None:
-        """Mark message as delivered."""
+    def mark_delivered(self, at: Optional[str] = None) -> None:
+        """Mark message as delivered (at the given timestamp, default now)."""
         self.status = MessageStatus.DELIVERED
-        self.delivered_at = datetime.now(timezone.utc).isoformat()
+        self.delivered_at = at or utc_now_iso()
     
     def mark_processed(self) -> None:
         """Mark message as processed."""
         self.status = MessageStatus.PROCESSED
-        self.processed_at = datetime.now(timezone.utc).isoformat()
+        self.processed_at = utc_now_iso()
 
 
 # =============================================================================
@@ -8,7 +8,8 @@ This module defines valid phases and which transitions are allowed.
 from enum import Enum
 from typing import Set, Dict, Optional, Union
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+
+from .clock import utc_now_iso
 
 
 class Phase(str, Enum):
@@ -88,7 +89,7 @@ class PhaseTransition:
     reason: str
     triggered_by: str  # "orchestrator", "user", "agent:{role}"
     timestamp: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
+        default_factory=utc_now_iso
     )
 
     def to_dict(self) -> dict:
@@ -111,7 +112,7 @@ class PhaseTransition:
             to_phase=Phase(data["to_phase"]),
             reason=data["reason"],
             triggered_by=data["triggered_by"],
-            timestamp=data.get("timestamp", datetime.now(timezone.utc).isoformat()),
+            timestamp=data.get("timestamp") or utc_now_iso(),
         )
 
 
@@ -7,10 +7,10 @@ how it should be structured, and tracks progress through the pipeline.
 
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
-from datetime import datetime, timezone
 from enum import Enum
 import uuid
 
+from .clock import utc_now_iso
 from .phase import Phase
 from .errors import ErrorReport
 
@@ -30,7 +30,7 @@ class TypeKind(str, Enum):
 # INTERFACE DEFINITIONS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class InterfaceMember:
     """A member of an interface (method, property)."""
     name: str
@@ -56,7 +56,7 @@ class InterfaceMember:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Interface:
     """An interface this spec provides or requires."""
     name: str
@@ -79,7 +79,7 @@ class Interface:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SharedType:
     """A shared type definition."""
     name: str
@@ -109,7 +109,7 @@ class SharedType:
 # STRUCTURE DEFINITIONS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ClassDefinition:
     """A class/module to be implemented."""
     name: str
@@ -138,7 +138,7 @@ class ClassDefinition:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Dependency:
     """Internal dependency between components."""
     component: str
@@ -161,7 +161,7 @@ class Dependency:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ChildRef:
     """Reference to a child spec."""
     name: str
@@ -191,7 +191,7 @@ class ChildRef:
 # CRITERIA
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Criterion:
     """An acceptance criterion."""
     id: str
@@ -221,7 +221,7 @@ class Criterion:
 # TECH STACK & CONSTRAINTS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class TechStack:
     """Technology stack configuration."""
     language: str  # "Python", "C#", "TypeScript", etc.
@@ -262,7 +262,7 @@ class TechStack:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Constraints:
     """Constraints on implementation."""
     tech_stack: Optional[TechStack] = None
@@ -343,10 +343,10 @@ class Spec:
     
     # Timestamps
     created_at: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
+        default_factory=utc_now_iso
     )
     updated_at: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
+        default_factory=utc_now_iso
     )
     
     # Paths (set by orchestrator)
@@ -412,14 +412,14 @@ class Spec:
             iteration=data.get("iteration", 0),
             max_iterations=data.get("max_iterations", 15),
             errors=[ErrorReport.from_dict(e) for e in data.get("errors", [])],
-            created_at=data.get("created_at", datetime.now(timezone.utc).isoformat()),
-            updated_at=data.get("updated_at", datetime.now(timezone.utc).isoformat()),
+            created_at=data.get("created_at") or utc_now_iso(),
+            updated_at=data.get("updated_at") or utc_now_iso(),
             spec_dir=data.get("spec_dir", ""),
         )
     
     def touch(self) -> None:
         """Update the updated_at timestamp."""
-        self.updated_at = datetime.now(timezone.utc).isoformat()
+        self.updated_at = utc_now_iso()
     
     def get_effective_tech_stack(self) -> Optional[TechStack]:
         """Get tech stack from constraints."""
@@ -14,9 +14,11 @@ import sys
 import os
 from typing import Dict, Any, Optional, List
 from pathlib import Path
-from datetime import datetime, timezone
 
+from ..core.clock import utc_now_iso
+from ..core.jsonio import dumps, dumps_bytes, loads, read_json
 from .scope import (
+    FILE_WRITE_TOOLS,
     is_path_allowed,
     is_tool_allowed,
     get_agent_context_from_env,
@@ -26,63 +28,63 @@ from .scope import (
 def read_hook_input() -> Dict[str, Any]:
     """Read hook input from stdin."""
     try:
-        return json.loads(sys.stdin.read())
+        return loads(sys.stdin.read())
     except json.JSONDecodeError:
         return {}
 
 
 def write_hook_output(output: Dict[str, Any]) -> None:
     """Write hook output to stdout."""
-    print(json.dumps(output))
+    print(dumps(output))
+
+
+# Project root -> state directory already created for it
+_state_dirs: Dict[str, Path] = {}
 
 
 def get_state_dir() -> Path:
-    """Get the state directory for persistence."""
+    """Get the state directory for persistence (created once per project root)."""
     project_root = os.environ.get("RALPH_PROJECT_ROOT", ".")
-    state_dir = Path(project_root) / ".ralph" / "state"
-    state_dir.mkdir(parents=True, exist_ok=True)
+    state_dir = _state_dirs.get(project_root)
+    if state_dir is None:
+        state_dir = Path(project_root) / ".ralph" / "state"
+        state_dir.mkdir(parents=True, exist_ok=True)
+        _state_dirs[project_root] = state_dir
     return state_dir
 
 
-def load_pending_messages(spec_id: str) -> List[Dict]:
+def load_pending_messages(spec_id: str, state_dir: Optional[Path] = None) -> List[Dict]:
     """Load pending messages for a spec from state."""
-    state_dir = get_state_dir()
+    state_dir = state_dir or get_state_dir()
     inbox_file = state_dir / f"inbox_{spec_id}.json"
     
-    if inbox_file.exists():
-        try:
-            data = json.loads(inbox_file.read_text(encoding="utf-8"))
-            return data.get("messages", [])
-        except (json.JSONDecodeError, IOError):
-            pass
-    
-    return []
+    try:
+        data = read_json(inbox_file)
+        return data.get("messages", [])
+    except (json.JSONDecodeError, IOError):
+        return []
 
 
-def clear_pending_messages(spec_id: str) -> None:
+def clear_pending_messages(spec_id: str, state_dir: Optional[Path] = None) -> None:
     """Clear pending messages after delivery."""
-    state_dir = get_state_dir()
+    state_dir = state_dir or get_state_dir()
     inbox_file = state_dir / f"inbox_{spec_id}.json"
-    
-    if inbox_file.exists():
-        inbox_file.unlink()
+    inbox_file.unlink(missing_ok=True)
 
 
-def track_artifact(spec_id: str, file_path: str) -> None:
+def track_artifact(spec_id: str, file_path: str, state_dir: Optional[Path] = None) -> None:
     """Track an artifact created by the agent."""
-    state_dir = get_state_dir()
+    state_dir = state_dir or get_state_dir()
     artifacts_file = state_dir / f"artifacts_{spec_id}.json"
     
-    artifacts = []
-    if artifacts_file.exists():
-        try:
-            artifacts = json.loads(artifacts_file.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, IOError):
-            pass
+    try:
+        artifacts = read_json(artifacts_file)
+    except (json.JSONDecodeError, IOError):
+        artifacts = []
     
     if file_path not in artifacts:
         artifacts.append(file_path)
-        artifacts_file.write_text(json.dumps(artifacts), encoding="utf-8")
+        artifacts_file.write_bytes(dumps_bytes(artifacts))
 
 
 def log_tool_use(
@@ -90,13 +92,14 @@ def log_tool_use(
     tool_name: str,
     tool_input: Dict,
     tool_response: Optional[Dict] = None,
+    state_dir: Optional[Path] = None,
 ) -> None:
     """Log tool use for audit trail."""
-    state_dir = get_state_dir()
+    state_dir = state_dir or get_state_dir()
     audit_file = state_dir / "audit.jsonl"
 
     entry = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": utc_now_iso(),
         "spec_id": spec_id,
         "tool_name": tool_name,
         "tool_input": tool_input,
@@ -104,7 +107,7 @@ def log_tool_use(
     }
     
     with open(audit_file, "a", encoding="utf-8") as f:
-        f.write(json.dumps(entry) + "\n")
+        f.write(dumps(entry) + "\n")
 
 
 # =============================================================================
@@ -156,8 +159,7 @@ def run_pre_tool_use() -> None:
         return
 
     # Check path restrictions for file operations
-    file_tools = ["Write", "Edit", "str_replace_editor", "create_file", "MultiEdit"]
-    if tool_name in file_tools:
+    if tool_name in FILE_WRITE_TOOLS:
         file_path = tool_input.get("file_path") or tool_input.get("path") or ""
 
         if file_path:
@@ -176,13 +178,17 @@ def run_pre_tool_use() -> None:
                 return
 
     # Check for pending messages to inject
-    pending = load_pending_messages(spec_id)
+    state_dir = get_state_dir()
+    pending = load_pending_messages(spec_id, state_dir)
     if pending:
         # Clear messages so they're not re-delivered
-        clear_pending_messages(spec_id)
+        clear_pending_messages(spec_id, state_dir)
 
-        message_text = f"You have {len(pending)} pending message(s):\n" + \
-                      "\n".join(f"- {m.get('type')}: {json.dumps(m.get('payload', {}))}" for m in pending)
+        message_text = f"You have {len(pending)} pending message(s):\n" + "\n".join(
+            f"- {m.get('type')}: "
+            f"{dumps(m.get('payload', {}))}"
+            for m in pending
+        )
         write_hook_output({
             "additionalContext": message_text,
         })
@@ -215,14 +221,14 @@ def run_post_tool_use() -> None:
     spec_id = context.get("spec_id", "unknown") if context else "unknown"
 
     # Log for audit
-    log_tool_use(spec_id, tool_name, tool_input, tool_response)
+    state_dir = get_state_dir()
+    log_tool_use(spec_id, tool_name, tool_input, tool_response, state_dir)
 
     # Track file artifacts
-    file_tools = ["Write", "Edit", "str_replace_editor", "create_file", "MultiEdit"]
-    if tool_name in file_tools:
+    if tool_name in FILE_WRITE_TOOLS:
         file_path = tool_input.get("file_path") or tool_input.get("path") or ""
         if file_path:
-            track_artifact(spec_id, file_path)
+            track_artifact(spec_id, file_path, state_dir)
 
     # PostToolUse hooks observe but don't block (empty dict = acknowledge)
     write_hook_output({})
@@ -253,13 +259,13 @@ def run_on_stop() -> None:
     completion_file = state_dir / f"complete_{spec_id}.json"
 
     completion_data = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": utc_now_iso(),
         "spec_id": spec_id,
         "stop_reason": stop_reason,
         "success": stop_reason in ["end_turn", "tool_use"],
     }
 
-    completion_file.write_text(json.dumps(completion_data), encoding="utf-8")
+    completion_file.write_bytes(dumps_bytes(completion_data))
 
     # Stop hooks don't block (empty dict = acknowledge)
     write_hook_output({})
@@ -269,6 +275,14 @@ def run_on_stop() -> None:
 # CLI ENTRY POINTS
 # =============================================================================
 
+# Hook type (command line argument) -> entry point
+HOOKS = {
+    "pre_tool_use": run_pre_tool_use,
+    "post_tool_use": run_post_tool_use,
+    "on_stop": run_on_stop,
+}
+
+
 def main():
     """Main entry point for hook scripts."""
     if len(sys.argv) < 2:
@@ -276,16 +290,12 @@ def main():
         sys.exit(1)
     
     hook_type = sys.argv[1]
-    
-    if hook_type == "pre_tool_use":
-        run_pre_tool_use()
-    elif hook_type == "post_tool_use":
-        run_post_tool_use()
-    elif hook_type == "on_stop":
-        run_on_stop()
-    else:
+    hook = HOOKS.get(hook_type)
+    if hook is None:
         print(f"Unknown hook type: {hook_type}", file=sys.stderr)
         sys.exit(1)
+    
+    hook()
 
 
 if __name__ == "__main__":
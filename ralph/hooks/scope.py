@@ -4,12 +4,18 @@ Scope enforcement for the Ralph pipeline.
 Determines whether an agent is allowed to access a given path.
 """
 
-from typing import List, Tuple, Optional
+from typing import Any, List, Tuple, Optional
 from pathlib import Path
 import os
 import json
 import fnmatch
 
+from ..core.jsonio import loads, read_json
+
+
+# Tools that write files, and so are subject to path checks and artifact tracking
+FILE_WRITE_TOOLS = frozenset({"Write", "Edit", "str_replace_editor", "create_file", "MultiEdit"})
+
 
 def normalize_path(path: str) -> str:
     """Normalize a path for comparison."""
@@ -118,25 +124,44 @@ def is_tool_allowed(
     return False, f"Tool not in allowed list: {allowed_tools}"
 
 
+# Last parsed agent context: (source key, context). The key is the context
+# file's (path, mtime_ns, size) or the inline JSON string itself.
+_context_cache: Optional[Tuple[Any, dict]] = None
+
+
 def get_agent_context_from_env() -> Optional[dict]:
     """
     Load agent context from environment.
     
-    Hooks use this to get the context set by the orchestrator.
+    Hooks use this to get the context set by the orchestrator. The parsed
+    context is reused until the context file or variable changes. Treat the
+    returned dict as read-only.
     """
+    global _context_cache
+    
     # Try context file first
     context_file = os.environ.get("RALPH_CONTEXT_FILE")
-    if context_file and Path(context_file).exists():
+    if context_file:
         try:
-            return json.loads(Path(context_file).read_text(encoding="utf-8"))
+            stat = os.stat(context_file)
+            key = (context_file, stat.st_mtime_ns, stat.st_size)
+            if _context_cache and _context_cache[0] == key:
+                return _context_cache[1]
+            context = read_json(Path(context_file))
+            _context_cache = (key, context)
+            return context
         except (json.JSONDecodeError, IOError):
             pass
     
     # Try inline JSON
     context_json = os.environ.get("RALPH_AGENT_CONTEXT")
     if context_json:
+        if _context_cache and _context_cache[0] == context_json:
+            return _context_cache[1]
         try:
-            return json.loads(context_json)
+            context = loads(context_json)
+            _context_cache = (context_json, context)
+            return context
         except json.JSONDecodeError:
             pass
     
@@ -15,11 +15,16 @@ Usage:
 
 from typing import Dict, Any, Optional, List, Callable, Awaitable
 from pathlib import Path
-import json
 
-from claude_agent_sdk import HookMatcher
+try:
+    from claude_agent_sdk import HookMatcher
+    HAS_CLAUDE_AGENT_SDK = True
+except ImportError:
+    HAS_CLAUDE_AGENT_SDK = False
 
-from .scope import is_path_allowed, is_tool_allowed
+from ..core.clock import utc_now_iso
+from ..core.jsonio import dumps
+from .scope import FILE_WRITE_TOOLS, is_path_allowed, is_tool_allowed
 
 
 # Type alias for hook callbacks
@@ -57,8 +62,7 @@ async def pre_tool_use_hook(
         }
 
     # Check path restrictions for file operations
-    file_tools = ["Write", "Edit", "str_replace_editor", "create_file", "MultiEdit"]
-    if tool_name in file_tools:
+    if tool_name in FILE_WRITE_TOOLS:
         file_path = tool_input.get("file_path") or tool_input.get("path") or ""
         if file_path:
             path_allowed, path_reason = is_path_allowed(
@@ -93,8 +97,7 @@ async def post_tool_use_hook(
     # Track file artifacts
     artifact_tracker = context.get("artifact_tracker")
     if artifact_tracker is not None:
-        file_tools = ["Write", "Edit", "str_replace_editor", "create_file", "MultiEdit"]
-        if tool_name in file_tools:
+        if tool_name in FILE_WRITE_TOOLS:
             file_path = tool_input.get("file_path") or tool_input.get("path") or ""
             if file_path and file_path not in artifact_tracker:
                 artifact_tracker.append(file_path)
@@ -148,12 +151,10 @@ def _log_tool_failure(
     is_interrupt: bool,
 ) -> None:
     """Log tool failure to audit trail."""
-    from datetime import datetime, timezone
-
     audit_file = Path(state_dir) / "audit.jsonl"
 
     entry = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": utc_now_iso(),
         "event": "tool_failure",
         "tool_name": tool_name,
         "error": error[:500],  # Truncate long errors
@@ -162,7 +163,7 @@ def _log_tool_failure(
 
     try:
         with open(audit_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry) + "\n")
+            f.write(dumps(entry) + "\n")
     except Exception:
         pass  # Don't fail the hook if logging fails
 
@@ -196,6 +197,9 @@ def create_ralph_hooks(
             ...
         )
     """
+    if not HAS_CLAUDE_AGENT_SDK:
+        raise ImportError("claude-agent-sdk not installed. Run: pip install claude-agent-sdk")
+
     # Create context that will be passed to hooks
     context = {
         "allowed_paths": allowed_paths or [],
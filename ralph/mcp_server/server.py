@@ -12,11 +12,25 @@ This server is a thin frontend that:
 All orchestration logic lives in the Orchestrator.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Tuple
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import functools
+import os
 import sys
+import time
 import logging
 
+from ..core.spec import (
+    ClassDefinition, Interface, SharedType, Dependency,
+    Criterion, ChildRef,
+)
+from ..core.phase import Phase, PHASE_TRANSITIONS
+from ..core.message import Message, MessageType
+from ..core.errors import ErrorReport, ErrorCategory, ErrorSeverity
+from ..core import eventloop
+
 # Configure logging to stderr (stdout breaks MCP protocol)
 logging.basicConfig(
     level=logging.INFO,
@@ -32,19 +46,48 @@ try:
 except ImportError:
     HAS_MCP_SDK = False
 
+# Working directory -> resolved project root
+_project_roots: Dict[str, Path] = {}
+
 
 def find_project_root() -> Path:
-    """Find the project root by looking for ralph.config.json."""
+    """
+    Find the project root by looking for ralph.config.json.
+
+    The ancestor walk is done once per working directory.
+    """
     cwd = Path.cwd()
+    root = _project_roots.get(str(cwd))
+    if root is not None:
+        return root
 
+    root = cwd
     # Check current dir and parents
     for path in [cwd, *cwd.parents]:
-        if (path / "ralph.config.json").exists():
-            return path
-        if path == path.parent:
+        if os.path.isfile(path / "ralph.config.json"):
+            root = path
             break
 
-    return cwd
+    _project_roots[str(cwd)] = root
+    return root
+
+
+# Fields agents may set via update_spec, mapped to the per-item converter
+# for list fields (None for plain values)
+SPEC_UPDATE_FIELDS: Dict[str, Optional[Callable[[Dict[str, Any]], Any]]] = {
+    "is_leaf": None,
+    "problem": None,
+    "success_criteria": None,
+    "context": None,
+    "classes": ClassDefinition.from_dict,
+    "provides": Interface.from_dict,
+    "requires": Interface.from_dict,
+    "shared_types": SharedType.from_dict,
+    "dependencies": Dependency.from_dict,
+    "children": ChildRef.from_dict,
+    "acceptance_criteria": Criterion.from_dict,
+    "edge_cases": Criterion.from_dict,
+}
 
 
 # =============================================================================
@@ -68,6 +111,64 @@ def get_orchestrator() -> "Orchestrator":
     return _orchestrator
 
 
+# =============================================================================
+# WORKER THREADS
+# =============================================================================
+
+# Spec store reads run here rather than in the loop's default executor, so
+# other run_in_executor users (e.g. the SDK's transport) can't starve them.
+# The store's lock makes each call safe from any worker, so a quick get_spec
+# doesn't have to wait for a slow full-tree scan to finish first.
+_spec_io_executor = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 4),
+    thread_name_prefix="ralph-spec-io",
+)
+
+
+async def _run_blocking(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking spec store call on the spec I/O pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _spec_io_executor, functools.partial(fn, *args, **kwargs)
+    )
+
+
+# =============================================================================
+# READ CACHE
+# =============================================================================
+
+# Seconds a polled read tool's result is reused (dashboards poll every few seconds)
+READ_CACHE_TTL = 2.0
+
+# (tool name, args) -> (expiry, spec store generation, result)
+_read_cache: Dict[Tuple, Tuple[float, int, Dict[str, Any]]] = {}
+
+
+def _get_cached_read(key: Tuple) -> Optional[Dict[str, Any]]:
+    """
+    Return a cached read-tool result if it is still valid.
+
+    A result is valid until its TTL expires or a spec is saved or deleted
+    through this server's store, whichever comes first. The TTL bounds
+    staleness from writes made by other processes.
+    """
+    entry = _read_cache.get(key)
+    if entry is None:
+        return None
+    expiry, generation, result = entry
+    if time.monotonic() >= expiry or generation != get_orchestrator().spec_store.generation:
+        del _read_cache[key]
+        return None
+    return result
+
+
+def _cache_read(key: Tuple, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Store a read-tool result in the read cache and return it."""
+    generation = get_orchestrator().spec_store.generation
+    _read_cache[key] = (time.monotonic() + READ_CACHE_TTL, generation, result)
+    return result
+
+
 # =============================================================================
 # MCP SERVER
 # =============================================================================
@@ -76,18 +177,30 @@ if HAS_MCP_SDK:
     mcp = FastMCP("ralph")
 
     @mcp.tool()
-    def get_status() -> Dict[str, Any]:
+    async def get_status() -> Dict[str, Any]:
         """Get current pipeline status including all specs and their phases."""
+        cached = _get_cached_read(("get_status",))
+        if cached is not None:
+            return cached
+
         orch = get_orchestrator()
-        return orch.get_status_summary()
+        # Spec scans read every spec.json; keep them off the event loop so
+        # running agents and other tool calls aren't stalled. The summary
+        # updates the orchestrator's status, so it is built back on the loop.
+        specs = await _run_blocking(orch.spec_store.list_all)
+        return _cache_read(("get_status",), orch.get_status_summary(specs))
 
     @mcp.tool()
-    def get_pending_approvals() -> Dict[str, Any]:
+    async def get_pending_approvals() -> Dict[str, Any]:
         """Get list of specs awaiting user approval."""
+        cached = _get_cached_read(("get_pending_approvals",))
+        if cached is not None:
+            return cached
+
         orch = get_orchestrator()
-        pending = orch.get_pending_approvals()
+        pending = await _run_blocking(orch.get_pending_approvals)
 
-        return {
+        return _cache_read(("get_pending_approvals",), {
             "count": len(pending),
             "specs": [
                 {
@@ -99,13 +212,14 @@ if HAS_MCP_SDK:
                 }
                 for p in pending
             ],
-        }
+        })
 
     @mcp.tool()
-    def get_spec(spec_id: str) -> Dict[str, Any]:
+    async def get_spec(spec_id: str) -> Dict[str, Any]:
         """Get details of a specific spec by ID."""
         orch = get_orchestrator()
-        spec = orch.get_spec(spec_id)
+        # A cache miss walks the specs directory; keep it off the event loop
+        spec = await _run_blocking(orch.get_spec, spec_id)
 
         if spec is None:
             return {"error": f"Spec '{spec_id}' not found"}
@@ -297,20 +411,22 @@ if HAS_MCP_SDK:
             }
 
     @mcp.tool()
-    def get_startable_specs() -> Dict[str, Any]:
+    async def get_startable_specs() -> Dict[str, Any]:
         """
         Get list of specs that can be started (DRAFT or READY phase).
 
         Returns specs that are waiting to begin processing. Use start_spec
         to kick these into the architecture phase.
         """
-        from ..core.phase import Phase
+        cached = _get_cached_read(("get_startable_specs",))
+        if cached is not None:
+            return cached
 
         orch = get_orchestrator()
 
         startable = []
 
-        for spec in orch.spec_store.list_all():
+        for spec in await _run_blocking(orch.spec_store.list_all):
             if spec.phase in (Phase.DRAFT, Phase.READY):
                 startable.append({
                     "id": spec.id,
@@ -321,10 +437,10 @@ if HAS_MCP_SDK:
                     "parent_id": spec.parent_id,
                 })
 
-        return {
+        return _cache_read(("get_startable_specs",), {
             "count": len(startable),
             "specs": startable,
-        }
+        })
 
     @mcp.tool()
     async def restart_spec(
@@ -394,7 +510,7 @@ if HAS_MCP_SDK:
             }
 
     @mcp.tool()
-    def get_restartable_specs(include_stuck: bool = True) -> Dict[str, Any]:
+    async def get_restartable_specs(include_stuck: bool = True) -> Dict[str, Any]:
         """
         Get list of specs that can be restarted or unstuck.
 
@@ -406,7 +522,10 @@ if HAS_MCP_SDK:
                 (architecture, implementation, integration) that might be stuck/hung.
                 These can be unstuck using restart_spec with unstuck=True.
         """
-        from ..core.phase import Phase, PHASE_TRANSITIONS
+        cache_key = ("get_restartable_specs", include_stuck)
+        cached = _get_cached_read(cache_key)
+        if cached is not None:
+            return cached
 
         orch = get_orchestrator()
 
@@ -416,7 +535,7 @@ if HAS_MCP_SDK:
         # Phases that can be unstuck (active working phases)
         active_phases = {Phase.ARCHITECTURE, Phase.IMPLEMENTATION, Phase.INTEGRATION}
 
-        for spec in orch.spec_store.list_all():
+        for spec in await _run_blocking(orch.spec_store.list_all):
             # Check for FAILED/BLOCKED specs (can be fully restarted)
             if spec.phase in (Phase.FAILED, Phase.BLOCKED):
                 # Determine valid restart options
@@ -464,11 +583,74 @@ if HAS_MCP_SDK:
                     "can_unstuck": True,
                 })
 
-        return {
+        return _cache_read(cache_key, {
             "restartable_count": len(restartable),
             "stuck_count": len(stuck),
             "restartable": restartable,
             "stuck": stuck,
+        })
+
+    # Read-only tools that batch_read may dispatch to
+    BATCHABLE_READ_TOOLS: Dict[str, Callable[..., Awaitable[Dict[str, Any]]]] = {
+        "get_status": get_status,
+        "get_pending_approvals": get_pending_approvals,
+        "get_spec": get_spec,
+        "get_startable_specs": get_startable_specs,
+        "get_restartable_specs": get_restartable_specs,
+    }
+
+    @mcp.tool()
+    async def batch_read(
+        calls: List[Dict[str, Any]],
+        max_concurrent: int = 8,
+    ) -> Dict[str, Any]:
+        """
+        Run several read-only tools in one call.
+
+        Lets a dashboard refresh (e.g. status + approvals + startable specs)
+        in a single round-trip. Calls are dispatched concurrently, and their
+        spec store reads overlap on the spec I/O pool; each result is
+        returned in the same position as its call.
+
+        Args:
+            calls: List of {"name": tool name, "arguments": {...}}. Supported
+                tools: get_status, get_pending_approvals, get_spec,
+                get_startable_specs, get_restartable_specs
+            max_concurrent: Maximum number of calls running at once
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
+
+        def call_name(call: Any) -> str:
+            return call.get("name", "") if isinstance(call, dict) else ""
+
+        async def run_call(call: Any) -> Dict[str, Any]:
+            if not isinstance(call, dict):
+                return {"error": "Each call must be an object with a 'name'"}
+
+            name = call.get("name", "")
+            tool = BATCHABLE_READ_TOOLS.get(name)
+            if tool is None:
+                return {"error": f"Tool '{name}' cannot be batched"}
+
+            arguments = call.get("arguments") or {}
+            if not isinstance(arguments, dict):
+                return {"error": f"Arguments for '{name}' must be an object"}
+
+            async with semaphore:
+                try:
+                    return await tool(**arguments)
+                except Exception as e:
+                    logger.exception(f"Error in batched call to {name}")
+                    return {"error": str(e)}
+
+        results = await asyncio.gather(*(run_call(call) for call in calls))
+
+        return {
+            "count": len(results),
+            "results": [
+                {"name": call_name(call), "result": result}
+                for call, result in zip(calls, results)
+            ],
         }
 
     # =========================================================================
@@ -487,47 +669,27 @@ if HAS_MCP_SDK:
             spec_id: The spec to update
             updates: Fields to update (is_leaf, classes, children, shared_types, etc.)
         """
-        from ..core.spec import (
-            ClassDefinition, Interface, SharedType, Dependency,
-            Criterion, ChildRef
-        )
-
         orch = get_orchestrator()
         spec = orch.get_spec(spec_id)
 
         if spec is None:
             return {"error": f"Spec '{spec_id}' not found"}
 
-        # Type converters for complex fields
-        converters = {
-            "classes": lambda items: [ClassDefinition.from_dict(c) for c in items],
-            "provides": lambda items: [Interface.from_dict(i) for i in items],
-            "requires": lambda items: [Interface.from_dict(i) for i in items],
-            "shared_types": lambda items: [SharedType.from_dict(t) for t in items],
-            "dependencies": lambda items: [Dependency.from_dict(d) for d in items],
-            "children": lambda items: [ChildRef.from_dict(c) for c in items],
-            "acceptance_criteria": lambda items: [Criterion.from_dict(c) for c in items],
-            "edge_cases": lambda items: [Criterion.from_dict(c) for c in items],
-        }
-
-        simple_fields = {"is_leaf", "problem", "success_criteria", "context"}
-
-        # Apply updates to spec object
-        allowed_fields = {
-            "is_leaf", "classes", "children", "shared_types",
-            "provides", "requires", "dependencies",
-            "acceptance_criteria", "edge_cases",
-            "problem", "success_criteria", "context",
-        }
-
+        # Apply updates to spec object in one pass over the field table
         applied = []
         for key, value in updates.items():
-            if key in allowed_fields and hasattr(spec, key):
-                if key in converters:
-                    setattr(spec, key, converters[key](value))
-                elif key in simple_fields:
-                    setattr(spec, key, value)
-                applied.append(key)
+            if key not in SPEC_UPDATE_FIELDS:
+                continue
+            convert = SPEC_UPDATE_FIELDS[key]
+            if convert is not None:
+                # Proposers resend whole sections; keep the existing objects
+                # when a section comes back unchanged
+                if value == [item.to_dict() for item in getattr(spec, key)]:
+                    applied.append(key)
+                    continue
+                value = [convert(item) for item in value]
+            setattr(spec, key, value)
+            applied.append(key)
 
         # Save via spec store
         orch.spec_store.save(spec)
@@ -552,8 +714,6 @@ if HAS_MCP_SDK:
             message_type: Type of message (phase_complete, approval_response, error_report)
             payload: Message payload with details
         """
-        from ..core.message import Message, MessageType
-
         orch = get_orchestrator()
         spec = orch.get_spec(spec_id)
 
@@ -601,8 +761,6 @@ if HAS_MCP_SDK:
             message: Human-readable error message
             details: Additional details (file, line, stack trace, etc.)
         """
-        from ..core.errors import ErrorReport, ErrorCategory, ErrorSeverity
-
         orch = get_orchestrator()
         spec = orch.get_spec(spec_id)
 
@@ -633,17 +791,15 @@ if HAS_MCP_SDK:
         }
 
     @mcp.tool()
-    def get_sibling_status(spec_id: str) -> Dict[str, Any]:
+    async def get_sibling_status(spec_id: str) -> Dict[str, Any]:
         """
         Get status of sibling specs (for coordination).
 
         Args:
             spec_id: The spec asking about its siblings
         """
-        from ..core.phase import Phase
-
         orch = get_orchestrator()
-        spec = orch.get_spec(spec_id)
+        spec = await _run_blocking(orch.get_spec, spec_id)
 
         if spec is None:
             return {"error": f"Spec '{spec_id}' not found"}
@@ -652,7 +808,7 @@ if HAS_MCP_SDK:
             return {"siblings": [], "message": "No parent - this is a root spec"}
 
         # Get siblings via spec store
-        siblings_specs = orch.spec_store.list_children(spec.parent_id)
+        siblings_specs = await _run_blocking(orch.spec_store.list_children, spec.parent_id)
 
         siblings = [
             {
@@ -683,6 +839,11 @@ def main():
         sys.exit(1)
 
     logger.info("Ralph MCP Server starting...")
+    # Load specs and message bus state up front so the first tool call
+    # doesn't pay for it
+    get_orchestrator()
+    # FastMCP creates its own loop; the policy makes that a uvloop loop
+    eventloop.install_event_loop_policy()
     mcp.run()
 
 
@@ -9,9 +9,12 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Callable, Awaitable
 from datetime import datetime, timezone
 from pathlib import Path
-import json
 import asyncio
+import logging
+import os
+import threading
 from collections import defaultdict
+from itertools import islice
 
 from ..core.message import (
     Message,
@@ -19,11 +22,21 @@ from ..core.message import (
     MessagePriority,
     MessageStatus,
 )
+from ..core.clock import utc_now_iso
+from ..core.jsonio import dumps_bytes, loads, read_json, write_bytes_atomic
+
+
+logger = logging.getLogger(__name__)
 
 
 # Type alias for message handlers
 MessageHandler = Callable[[Message], Awaitable[None]]
 
+# The journal is compacted once it holds more than this many records per
+# live message (and at least COMPACT_MIN_RECORDS records)
+COMPACT_RECORDS_PER_MESSAGE = 4
+COMPACT_MIN_RECORDS = 256
+
 
 @dataclass
 class Inbox:
@@ -35,9 +48,18 @@ class Inbox:
         """Add a message to the inbox."""
         self.messages.append(message)
     
-    def get_pending(self) -> List[Message]:
-        """Get all pending messages."""
-        return [m for m in self.messages if m.status == MessageStatus.PENDING]
+    def get_pending(self, msg_type: Optional[MessageType] = None) -> List[Message]:
+        """Get pending messages, optionally only those of one type."""
+        if msg_type is None:
+            return [m for m in self.messages if m.status == MessageStatus.PENDING]
+        return [
+            m for m in self.messages
+            if m.status == MessageStatus.PENDING and m.type == msg_type
+        ]
+    
+    def has_pending(self) -> bool:
+        """Check for a pending message without building the pending list."""
+        return any(m.status == MessageStatus.PENDING for m in self.messages)
     
     def get_by_type(self, msg_type: MessageType) -> List[Message]:
         """Get messages of a specific type."""
@@ -46,8 +68,10 @@ class Inbox:
     def mark_all_delivered(self) -> List[Message]:
         """Mark all pending messages as delivered and return them."""
         pending = self.get_pending()
-        for msg in pending:
-            msg.mark_delivered()
+        if pending:
+            delivered_at = utc_now_iso()
+            for msg in pending:
+                msg.mark_delivered(delivered_at)
         return pending
     
     def clear_processed(self) -> int:
@@ -74,6 +98,17 @@ class MessageBus:
         self._wake_events: Dict[str, asyncio.Event] = {}
         self._state_dir = state_dir
         self._message_log: List[Message] = []
+        self._by_id: Dict[str, Message] = {}  # message id -> logged message
+        
+        # Append-only persistence: each change is queued as one JSONL record.
+        # Saves requested inside a running event loop are folded into one
+        # flush task that appends the queued records off the loop thread.
+        self._pending_records: List[bytes] = []
+        self._pending_snapshot: Optional[bytes] = None
+        self._journal_lines = 0
+        self._save_pending = False
+        self._flush_task: Optional[asyncio.Task] = None
+        self._write_lock = threading.Lock()
         
         # Load persisted state if available
         if state_dir:
@@ -114,6 +149,8 @@ class MessageBus:
         
         # Log for persistence
         self._message_log.append(message)
+        self._by_id[message.id] = message
+        self._journal({"msg": message.to_dict()})
         
         # Trigger wake event for blocking messages
         if message.priority == MessagePriority.BLOCKING:
@@ -126,18 +163,17 @@ class MessageBus:
                 await handler(message)
             except Exception as e:
                 # Log but don't fail
-                print(f"Handler error for {to_id}: {e}")
+                logger.warning("Handler error for %s: %s", to_id, e)
         
         # Call global handlers (registered for "*")
         for handler in self._handlers.get("*", []):
             try:
                 await handler(message)
             except Exception as e:
-                print(f"Global handler error: {e}")
+                logger.warning("Global handler error: %s", e)
         
         # Persist if state_dir configured
-        if self._state_dir:
-            self._save_state()
+        self._request_save()
         
         return message.id
     
@@ -148,13 +184,14 @@ class MessageBus:
         inbox = self._get_inbox(to_id)
         inbox.add(message)
         self._message_log.append(message)
+        self._by_id[message.id] = message
+        self._journal({"msg": message.to_dict()})
         
         if message.priority == MessagePriority.BLOCKING:
             event = self._get_wake_event(to_id)
             event.set()
         
-        if self._state_dir:
-            self._save_state()
+        self._request_save()
         
         return message.id
     
@@ -170,10 +207,7 @@ class MessageBus:
     ) -> List[Message]:
         """Get pending messages of a specific type."""
         inbox = self._get_inbox(recipient_id)
-        return [
-            m for m in inbox.get_pending()
-            if m.type == msg_type
-        ]
+        return inbox.get_pending(msg_type)
     
     def deliver(self, recipient_id: str) -> List[Message]:
         """
@@ -183,22 +217,22 @@ class MessageBus:
         """
         inbox = self._get_inbox(recipient_id)
         delivered = inbox.mark_all_delivered()
+        for msg in delivered:
+            self._journal_status(msg)
         
-        if self._state_dir:
-            self._save_state()
+        self._request_save()
         
         return delivered
     
     def mark_processed(self, message_id: str) -> bool:
         """Mark a message as processed."""
-        for inbox in self._inboxes.values():
-            for msg in inbox.messages:
-                if msg.id == message_id:
-                    msg.mark_processed()
-                    if self._state_dir:
-                        self._save_state()
-                    return True
-        return False
+        msg = self._by_id.get(message_id)
+        if msg is None:
+            return False
+        msg.mark_processed()
+        self._journal_status(msg)
+        self._request_save()
+        return True
     
     def register_handler(
         self,
@@ -246,31 +280,32 @@ class MessageBus:
     def has_pending(self, recipient_id: str) -> bool:
         """Check if recipient has pending messages."""
         inbox = self._get_inbox(recipient_id)
-        return len(inbox.get_pending()) > 0
+        return inbox.has_pending()
     
     def get_message(self, message_id: str) -> Optional[Message]:
         """Get a message by ID."""
-        for msg in self._message_log:
-            if msg.id == message_id:
-                return msg
-        return None
+        return self._by_id.get(message_id)
     
     def get_conversation(
         self,
         spec_id: str,
         limit: int = 100,
     ) -> List[Message]:
-        """Get all messages related to a spec."""
-        return [
-            m for m in self._message_log
-            if m.spec_id == spec_id
-        ][-limit:]
+        """Get the most recent messages related to a spec, oldest first."""
+        # Walk back from the newest message and stop once we have enough
+        recent = islice(
+            (m for m in reversed(self._message_log) if m.spec_id == spec_id),
+            limit,
+        )
+        return list(recent)[::-1]
     
     def clear_inbox(self, recipient_id: str) -> int:
         """Clear all messages for a recipient."""
         if recipient_id in self._inboxes:
             count = len(self._inboxes[recipient_id].messages)
             self._inboxes[recipient_id].messages.clear()
+            self._journal({"clear": recipient_id})
+            self._request_save()
             return count
         return 0
     
@@ -296,48 +331,242 @@ class MessageBus:
     # PERSISTENCE
     # =========================================================================
     
+    def _journal(self, record: Dict) -> None:
+        """Queue one journal record for the next save."""
+        if not self._state_dir:
+            return
+        line = dumps_bytes(record) + b"\n"
+        with self._write_lock:
+            self._pending_records.append(line)
+        self._journal_lines += 1
+    
+    def _journal_status(self, message: Message) -> None:
+        """Queue a status change for a message that is already journaled."""
+        self._journal({
+            "id": message.id,
+            "status": message.status.value,
+            "delivered_at": message.delivered_at,
+            "processed_at": message.processed_at,
+        })
+    
+    def _request_save(self) -> None:
+        """
+        Persist queued records, coalescing saves requested in the same loop tick.
+        
+        Inside a running event loop the write is handed to a single flush
+        task; requests made while it is pending fold into it. Outside an
+        event loop the records are written immediately.
+        """
+        if not self._state_dir:
+            return
+        
+        self._maybe_compact()
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._save_state()
+            return
+        
+        self._save_pending = True
+        if self._flush_task is None or self._flush_task.get_loop() is not loop:
+            self._flush_task = loop.create_task(self._flush_state())
+    
+    async def _flush_state(self) -> None:
+        """Write queued records from a worker thread until none are left."""
+        try:
+            await asyncio.sleep(0)  # Let sends from the same tick coalesce
+            while self._save_pending:
+                self._save_pending = False
+                await asyncio.to_thread(self._save_state)
+        except asyncio.CancelledError:
+            # Loop is shutting down - don't lose the latest records
+            self._save_state()
+            raise
+        except Exception as e:
+            logger.warning("Failed to save message bus state: %s", e)
+        finally:
+            self._flush_task = None
+    
+    async def flush(self) -> None:
+        """Wait until all requested saves have been written to disk."""
+        while self._flush_task is not None:
+            await self._flush_task
+    
     def _save_state(self) -> None:
-        """Save state to disk."""
+        """
+        Write queued records to disk.
+        
+        Records are taken under the write lock, so whichever thread writes
+        always appends everything queued so far, in order.
+        """
         if not self._state_dir:
             return
         
-        self._state_dir.mkdir(parents=True, exist_ok=True)
-        state_file = self._state_dir / "message_bus.json"
+        journal_file = self._state_dir / "message_bus.jsonl"
         
-        state = {
-            "messages": [m.to_dict() for m in self._message_log],
-            "inboxes": {
-                rid: [m.to_dict() for m in inbox.messages]
-                for rid, inbox in self._inboxes.items()
-            },
-        }
+        with self._write_lock:
+            snapshot, self._pending_snapshot = self._pending_snapshot, None
+            records, self._pending_records = self._pending_records, []
+            if snapshot is None and not records:
+                return
+            
+            try:
+                self._write_journal(journal_file, snapshot, records)
+            except FileNotFoundError:
+                self._state_dir.mkdir(parents=True, exist_ok=True)
+                self._write_journal(journal_file, snapshot, records)
+    
+    @staticmethod
+    def _write_journal(
+        journal_file: Path,
+        snapshot: Optional[bytes],
+        records: List[bytes],
+    ) -> None:
+        """Append records, or replace the journal when compacting."""
+        if snapshot is not None:
+            write_bytes_atomic(journal_file, snapshot + b"".join(records))
+        else:
+            with open(journal_file, "ab") as f:
+                f.write(b"".join(records))
+    
+    def _maybe_compact(self) -> None:
+        """
+        Replace the journal with a snapshot once it is mostly history.
+        
+        Every message costs one record when sent plus one per status change,
+        so the journal is rewritten when it holds more than a few records
+        per live message.
+        """
+        live = len(self._message_log)
+        if self._journal_lines <= max(COMPACT_MIN_RECORDS, COMPACT_RECORDS_PER_MESSAGE * live):
+            return
         
-        with open(state_file, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2)
+        snapshot = self._snapshot_state()
+        with self._write_lock:
+            # The snapshot already includes everything queued so far
+            self._pending_snapshot = snapshot
+            self._pending_records = []
+        self._journal_lines = live
+    
+    def _snapshot_state(self) -> bytes:
+        """Serialize current state as journal records, one per message."""
+        in_inbox = {
+            id(m) for inbox in self._inboxes.values() for m in inbox.messages
+        }
+        lines = []
+        for m in self._message_log:
+            record = {"msg": m.to_dict()}
+            if id(m) not in in_inbox:
+                record["inbox"] = False
+            lines.append(dumps_bytes(record) + b"\n")
+        return b"".join(lines)
     
     def _load_state(self) -> None:
-        """Load state from disk."""
+        """Load state from disk, migrating a legacy JSON snapshot if present."""
         if not self._state_dir:
             return
         
-        state_file = self._state_dir / "message_bus.json"
-        if not state_file.exists():
+        journal_file = self._state_dir / "message_bus.jsonl"
+        
+        try:
+            with open(journal_file, "rb") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            self._load_legacy_state()
+            return
+        except Exception as e:
+            logger.warning("Failed to load message bus state: %s", e)
             return
         
+        if lines and not lines[-1].endswith(b"\n"):
+            self._repair_torn_tail(journal_file, lines)
+        
+        for line in lines:
+            try:
+                self._replay(loads(line))
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                # One bad record shouldn't stop the rest of the bus from loading
+                logger.warning("Skipping unreadable message bus record: %s", e)
+        self._journal_lines = len(lines)
+    
+    @staticmethod
+    def _repair_torn_tail(journal_file: Path, lines: List[bytes]) -> None:
+        """
+        Fix a final journal line left without a newline by an interrupted append.
+        
+        A complete record just gets its newline; a partial one is cut off.
+        Either way the next append starts on a fresh line instead of being
+        glued onto the torn one. Updates lines in place to match the file.
+        """
+        tail = lines[-1]
         try:
-            with open(state_file, "r", encoding="utf-8") as f:
-                state = json.load(f)
-            
-            self._message_log = [
-                Message.from_dict(m) for m in state.get("messages", [])
-            ]
-            
-            for rid, messages in state.get("inboxes", {}).items():
-                inbox = self._get_inbox(rid)
-                inbox.messages = [Message.from_dict(m) for m in messages]
+            loads(tail)
+        except ValueError:
+            logger.warning("Dropping torn last record from message bus journal")
+            size = sum(len(line) for line in lines)
+            os.truncate(journal_file, size - len(tail))
+            lines.pop()
+        else:
+            with open(journal_file, "ab") as f:
+                f.write(b"\n")
+            lines[-1] = tail + b"\n"
+    
+    def _replay(self, record: Dict) -> None:
+        """Apply one journal record to the in-memory state."""
+        if "clear" in record:
+            self._get_inbox(record["clear"]).messages.clear()
+            return
+        
+        if "msg" in record:
+            message = Message.from_dict(record["msg"])
+            if message.id in self._by_id:
+                return
+            self._by_id[message.id] = message
+            self._message_log.append(message)
+            if record.get("inbox", True):
+                self._get_inbox(message.to_id).add(message)
+            return
         
+        message = self._by_id.get(record.get("id", ""))
+        if message is not None:
+            message.status = MessageStatus(record["status"])
+            message.delivered_at = record.get("delivered_at")
+            message.processed_at = record.get("processed_at")
+    
+    def _load_legacy_state(self) -> None:
+        """Load a message_bus.json snapshot and convert it to the journal."""
+        state_file = self._state_dir / "message_bus.json"
+        
+        try:
+            state = read_json(state_file)
+        except FileNotFoundError:
+            return
         except Exception as e:
-            print(f"Failed to load message bus state: {e}")
+            logger.warning("Failed to load message bus state: %s", e)
+            return
+        
+        self._message_log = [
+            Message.from_dict(m) for m in state.get("messages", [])
+        ]
+        by_id = self._by_id
+        by_id.update((m.id, m) for m in self._message_log)
+        
+        # Inboxes were stored as separate copies; point them at the log's objects
+        for rid, messages in state.get("inboxes", {}).items():
+            inbox = self._get_inbox(rid)
+            for data in messages:
+                message = by_id.get(data.get("id"))
+                if message is None:
+                    message = Message.from_dict(data)
+                    by_id[message.id] = message
+                    self._message_log.append(message)
+                inbox.messages.append(message)
+        
+        with self._write_lock:
+            self._pending_snapshot = self._snapshot_state()
+        self._save_state()
+        state_file.unlink(missing_ok=True)
 
 
 # =============================================================================
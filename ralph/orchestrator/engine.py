@@ -8,14 +8,16 @@ The central coordinator that:
 - Tracks overall progress
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set
 from dataclasses import dataclass, field
 from pathlib import Path
-from datetime import datetime, timezone
 import asyncio
-import json
+import re
+from collections import Counter
 
-from ..core.spec import Spec
+from ..core.clock import utc_now_iso
+from ..core.jsonio import dumps
+from ..core.spec import Spec, TechStack
 from ..core.phase import Phase, is_approval_phase
 from ..core.message import (
     Message,
@@ -37,7 +39,28 @@ from .state_machine import StateMachine
 from .spec_store import SpecStore
 
 
-@dataclass
+# Verdict markers scanned in agent output (compiled once, matched case-insensitively)
+_CRITIC_APPROVE_RE = re.compile(r"approved|lgtm", re.IGNORECASE)
+_CRITIC_REJECT_RE = re.compile(r"reject", re.IGNORECASE)
+_VERIFY_PASS_RE = re.compile(r"all tests pass|verification passed", re.IGNORECASE)
+_VERIFY_FAIL_RE = re.compile(r"fail|error", re.IGNORECASE)
+
+# Working phase -> approval phase entered when its agents report completion
+_APPROVAL_PHASE_AFTER: Dict[Phase, Phase] = {
+    Phase.ARCHITECTURE: Phase.AWAITING_ARCH_APPROVAL,
+    Phase.IMPLEMENTATION: Phase.AWAITING_IMPL_APPROVAL,
+    Phase.INTEGRATION: Phase.AWAITING_INTEG_APPROVAL,
+}
+
+# Approval phase -> approval type reported to the user
+_APPROVAL_TYPES: Dict[Phase, str] = {
+    Phase.AWAITING_ARCH_APPROVAL: "architecture",
+    Phase.AWAITING_IMPL_APPROVAL: "implementation",
+    Phase.AWAITING_INTEG_APPROVAL: "integration",
+}
+
+
+@dataclass(slots=True)
 class PipelineConfig:
     """Configuration for the pipeline."""
     max_iterations: int = 15
@@ -110,6 +133,8 @@ class Orchestrator:
         # Runtime state
         self._status = PipelineStatus()
         self._running_agents: Dict[str, asyncio.Task] = {}
+        self._agent_slots = asyncio.Semaphore(self.config.max_concurrent_agents)
+        self._handled_in_place: Set[str] = set()  # ids of messages we sent after acting on them
         self._shutdown_event = asyncio.Event()
         
         # Setup handlers
@@ -118,6 +143,14 @@ class Orchestrator:
     
     def _setup_message_handlers(self) -> None:
         """Set up handlers for incoming messages."""
+        # Message type -> handler(spec_id, payload)
+        self._message_handlers = {
+            MessageType.PHASE_COMPLETE: self._handle_phase_complete,
+            MessageType.ERROR_REPORT: self._handle_error_report,
+            MessageType.APPROVAL_RESPONSE: self._handle_approval_response,
+            MessageType.CHILD_COMPLETE: self._handle_child_complete,
+            MessageType.WAKE_SUPERVISOR: self._handle_wake_supervisor,
+        }
         self.message_bus.register_handler(
             "orchestrator",
             self._handle_orchestrator_message,
@@ -156,7 +189,7 @@ class Orchestrator:
         if spec.max_iterations == 15:
             spec.max_iterations = self.config.max_iterations
         
-        self.spec_store.save(spec)
+        # _process_spec saves the spec as it enters ARCHITECTURE
         await self._process_spec(spec)
         
         return spec.id
@@ -185,19 +218,22 @@ class Orchestrator:
         
         return result.success
     
-    def get_status(self) -> PipelineStatus:
-        """Get current pipeline status."""
-        specs = self.spec_store.list_all()
+    def get_status(self, specs: Optional[List[Spec]] = None) -> PipelineStatus:
+        """Get current pipeline status (from the given specs, or a fresh scan)."""
+        if specs is None:
+            specs = self.spec_store.list_all()
+        by_phase = Counter(s.phase for s in specs)
         self._status.specs_total = len(specs)
-        self._status.specs_complete = len([s for s in specs if s.phase == Phase.COMPLETE])
-        self._status.specs_failed = len([s for s in specs if s.phase == Phase.FAILED])
-        self._status.specs_blocked = len([s for s in specs if s.phase == Phase.BLOCKED])
+        self._status.specs_complete = by_phase[Phase.COMPLETE]
+        self._status.specs_failed = by_phase[Phase.FAILED]
+        self._status.specs_blocked = by_phase[Phase.BLOCKED]
         return self._status
     
-    def get_status_summary(self) -> Dict[str, Any]:
-        """Get detailed status summary."""
-        status = self.get_status()
-        specs = self.spec_store.list_all()
+    def get_status_summary(self, specs: Optional[List[Spec]] = None) -> Dict[str, Any]:
+        """Get detailed status summary (from the given specs, or a fresh scan)."""
+        if specs is None:
+            specs = self.spec_store.list_all()
+        status = self.get_status(specs)
         
         return {
             "status": status.to_dict(),
@@ -219,13 +255,9 @@ class Orchestrator:
         pending = []
 
         # Scan disk for all specs in approval phases (survives restart)
-        for spec in self.spec_store.list_all():
+        for spec in self.spec_store.iter_all():
             if is_approval_phase(spec.phase):
-                approval_type = {
-                    Phase.AWAITING_ARCH_APPROVAL: "architecture",
-                    Phase.AWAITING_IMPL_APPROVAL: "implementation",
-                    Phase.AWAITING_INTEG_APPROVAL: "integration",
-                }.get(spec.phase, "unknown")
+                approval_type = _APPROVAL_TYPES.get(spec.phase, "unknown")
 
                 pending.append(ApprovalRequestPayload(
                     spec_id=spec.id,
@@ -247,6 +279,7 @@ class Orchestrator:
         for task in self._running_agents.values():
             task.cancel()
         self._status.running = False
+        await self.message_bus.flush()
 
     async def start_spec(self, spec_id: str) -> Dict[str, Any]:
         """
@@ -286,21 +319,17 @@ class Orchestrator:
             )
             if not result.success:
                 return {"success": False, "error": result.error}
-            self.spec_store.save(spec)
 
-        # Now process from READY -> ARCHITECTURE
-        await self._process_spec(spec)
-
-        # Refresh spec to get updated phase
-        spec = self.spec_store.get(spec_id)
+        # Now process from READY -> ARCHITECTURE (saves the spec)
+        spec = await self._process_spec(spec)
 
         return {
             "success": True,
             "spec_id": spec_id,
-            "spec_name": spec.name if spec else "unknown",
+            "spec_name": spec.name,
             "previous_phase": previous_phase,
-            "new_phase": spec.phase.value if spec else "unknown",
-            "message": f"Spec started: {previous_phase} -> {spec.phase.value if spec else 'unknown'}",
+            "new_phase": spec.phase.value,
+            "message": f"Spec started: {previous_phase} -> {spec.phase.value}",
         }
 
     async def restart_spec(
@@ -476,8 +505,14 @@ class Orchestrator:
     # INTERNAL PROCESSING
     # =========================================================================
     
-    async def _process_spec(self, spec: Spec) -> None:
-        """Process a spec through its lifecycle."""
+    async def _process_spec(self, spec: Spec) -> Spec:
+        """
+        Process a spec through its lifecycle.
+        
+        Returns:
+            The store's current copy of the spec, so callers don't need to
+            reload it after the side effects have run
+        """
         if spec.phase == Phase.READY:
             result = self.state_machine.transition(
                 spec, Phase.ARCHITECTURE,
@@ -488,27 +523,25 @@ class Orchestrator:
             if result.success:
                 self.spec_store.save(spec)
                 await self.state_machine.execute_side_effects(spec, result.side_effects)
+        
+        return self.spec_store.get(spec.id) or spec
     
     async def _handle_orchestrator_message(self, message: Message) -> None:
         """Handle messages sent to the orchestrator."""
-        msg_type = message.type
-        spec_id = message.spec_id or message.from_id
-        
-        if msg_type == MessageType.PHASE_COMPLETE:
-            await self._handle_phase_complete(spec_id, message.payload)
-        elif msg_type == MessageType.ERROR_REPORT:
-            await self._handle_error_report(spec_id, message.payload)
-        elif msg_type == MessageType.APPROVAL_RESPONSE:
-            payload = message.payload
-            await self.handle_approval(
-                payload.get("spec_id", spec_id),
-                payload.get("approved", False),
-                payload.get("feedback", ""),
-            )
-        elif msg_type == MessageType.CHILD_COMPLETE:
-            await self._handle_child_complete(spec_id, message.payload)
-        elif msg_type == MessageType.WAKE_SUPERVISOR:
-            await self._handle_wake_supervisor(spec_id, message.payload)
+        if message.id in self._handled_in_place:
+            return
+        
+        handler = self._message_handlers.get(message.type)
+        if handler:
+            await handler(message.spec_id or message.from_id, message.payload)
+    
+    async def _handle_approval_response(self, spec_id: str, payload: Dict[str, Any]) -> None:
+        """Handle an approval decision sent as a message."""
+        await self.handle_approval(
+            payload.get("spec_id", spec_id),
+            payload.get("approved", False),
+            payload.get("feedback", ""),
+        )
     
     async def _handle_phase_complete(self, spec_id: str, payload: Dict[str, Any]) -> None:
         """Handle phase completion from an agent."""
@@ -517,15 +550,10 @@ class Orchestrator:
             return
         
         success = payload.get("success", False)
-        next_phase_map = {
-            Phase.ARCHITECTURE: Phase.AWAITING_ARCH_APPROVAL,
-            Phase.IMPLEMENTATION: Phase.AWAITING_IMPL_APPROVAL,
-            Phase.INTEGRATION: Phase.AWAITING_INTEG_APPROVAL,
-        }
         
-        if success and spec.phase in next_phase_map:
+        if success and spec.phase in _APPROVAL_PHASE_AFTER:
             result = self.state_machine.transition(
-                spec, next_phase_map[spec.phase],
+                spec, _APPROVAL_PHASE_AFTER[spec.phase],
                 triggered_by=f"agent:{spec.phase.value}",
                 reason=f"{spec.phase.value} complete",
             )
@@ -539,9 +567,55 @@ class Orchestrator:
         if not spec:
             return
         
+        if await self._record_error(spec, payload):
+            if spec.phase == Phase.IMPLEMENTATION:
+                await self._deploy_implementation_team(spec, "retry")
+            elif spec.phase == Phase.INTEGRATION:
+                await self._deploy_integration_team(spec, "retry")
+    
+    async def _report_error(self, spec: Spec, payload: Dict[str, Any]) -> bool:
+        """
+        Send an ERROR_REPORT for a failed attempt and record it on the spec.
+        
+        The message keeps the failure in the bus history for observers and
+        conversations. Its id is held in _handled_in_place while it is
+        delivered, so _handle_error_report doesn't record it again or start
+        a second retry. The marker stays out of the payload, which agents
+        also write.
+        
+        Returns:
+            True if the spec should be retried (see _record_error)
+        """
+        error_msg = Message(
+            from_id=spec.id,
+            to_id="orchestrator",
+            spec_id=spec.id,
+            type=MessageType.ERROR_REPORT,
+            payload=payload,
+        )
+        self._handled_in_place.add(error_msg.id)
+        try:
+            await self.message_bus.send(error_msg)
+        finally:
+            self._handled_in_place.discard(error_msg.id)
+        return await self._record_error(spec, payload)
+    
+    async def _record_error(self, spec: Spec, payload: Dict[str, Any]) -> bool:
+        """
+        Record an error on a spec and decide whether to retry.
+        
+        Returns:
+            True if the spec has iterations left and should be retried;
+            otherwise the spec has been moved to BLOCKED or FAILED
+        """
+        try:
+            category = ErrorCategory(payload.get("error_type", "agent"))
+        except ValueError:
+            category = ErrorCategory.AGENT
+        
         error = ErrorReport(
             iteration=spec.iteration,
-            category=ErrorCategory(payload.get("error_type", "agent")),
+            category=category,
             severity=ErrorSeverity.ERROR,
             message=payload.get("message", "Unknown error"),
             details=payload.get("details", {}),
@@ -552,21 +626,18 @@ class Orchestrator:
         if error.recoverable and spec.can_iterate():
             spec.increment_iteration()
             self.spec_store.save(spec)
-            
-            if spec.phase == Phase.IMPLEMENTATION:
-                await self._deploy_implementation_team(spec, "retry")
-            elif spec.phase == Phase.INTEGRATION:
-                await self._deploy_integration_team(spec, "retry")
-        else:
-            result = self.state_machine.transition(
-                spec,
-                Phase.BLOCKED if error.recoverable else Phase.FAILED,
-                triggered_by="orchestrator",
-                reason=f"Error: {error.message}",
-            )
-            if result.success:
-                self.spec_store.save(spec)
-                await self.state_machine.execute_side_effects(spec, result.side_effects)
+            return True
+        
+        result = self.state_machine.transition(
+            spec,
+            Phase.BLOCKED if error.recoverable else Phase.FAILED,
+            triggered_by="orchestrator",
+            reason=f"Error: {error.message}",
+        )
+        if result.success:
+            self.spec_store.save(spec)
+            await self.state_machine.execute_side_effects(spec, result.side_effects)
+        return False
     
     async def _handle_child_complete(self, parent_id: str, payload: Dict[str, Any]) -> None:
         """Handle notification that a child completed."""
@@ -574,7 +645,7 @@ class Orchestrator:
         if not parent:
             return
         
-        children = self.spec_store.list_children(parent_id)
+        children = await asyncio.to_thread(self.spec_store.list_children, parent_id)
         all_complete = all(c.phase == Phase.COMPLETE for c in children)
         
         if all_complete and parent.phase == Phase.AWAITING_CHILDREN:
@@ -603,6 +674,11 @@ class Orchestrator:
         )
         await self.message_bus.send(parent_message)
     
+    async def _invoke_agent(self, **kwargs: Any) -> AgentResult:
+        """Invoke an agent, waiting for a free slot if too many are running."""
+        async with self._agent_slots:
+            return await self.agent_invoker.invoke(**kwargs)
+    
     # =========================================================================
     # SIDE EFFECT HANDLERS
     # =========================================================================
@@ -613,7 +689,7 @@ class Orchestrator:
         
         for i in range(self.config.max_arch_iterations):
             # Proposer designs
-            proposer_result = await self.agent_invoker.invoke(
+            proposer_result = await self._invoke_agent(
                 role=AgentRole.PROPOSER,
                 spec=spec,
                 tech_stack=tech_stack,
@@ -623,15 +699,19 @@ class Orchestrator:
             if not proposer_result.success:
                 continue
             
-            spec = self.spec_store.get(spec.id) or spec
+            # The proposer writes through the MCP server (another process)
+            spec = self.spec_store.get_fresh(spec.id) or spec
             
-            # Critic reviews
-            critic_result = await self.agent_invoker.invoke(
-                role=AgentRole.CRITIC,
-                spec=spec,
-                tech_stack=tech_stack,
-                iteration=i + 1,
-            )
+            # Critic reviews (a dry run has no design to review)
+            if self.config.dry_run:
+                critic_result = AgentResult(success=True, output="[DRY RUN] Approved")
+            else:
+                critic_result = await self._invoke_agent(
+                    role=AgentRole.CRITIC,
+                    spec=spec,
+                    tech_stack=tech_stack,
+                    iteration=i + 1,
+                )
             
             if self._critic_approved(critic_result):
                 break
@@ -646,112 +726,111 @@ class Orchestrator:
         await self.message_bus.send(complete_msg)
     
     async def _deploy_implementation_team(self, spec: Spec, effect: str) -> None:
-        """Deploy the implementation team for a spec."""
-        tech_stack = spec.get_effective_tech_stack()
-        previous_errors = spec.errors if spec.iteration > 1 else []
+        """
+        Deploy the implementation team for a spec.
         
-        impl_result = await self.agent_invoker.invoke(
-            role=AgentRole.IMPLEMENTER,
-            spec=spec,
-            tech_stack=tech_stack,
-            iteration=spec.iteration,
-            previous_errors=previous_errors,
-        )
+        Failed attempts are recorded and retried here until the spec passes
+        or runs out of iterations.
+        """
+        tech_stack = spec.get_effective_tech_stack()
         
-        if not impl_result.success:
-            error_msg = Message(
-                from_id=spec.id,
-                to_id="orchestrator",
-                spec_id=spec.id,
-                type=MessageType.ERROR_REPORT,
-                payload={
+        while True:
+            previous_errors = spec.errors if spec.iteration > 1 else []
+            
+            impl_result = await self._invoke_agent(
+                role=AgentRole.IMPLEMENTER,
+                spec=spec,
+                tech_stack=tech_stack,
+                iteration=spec.iteration,
+                previous_errors=previous_errors,
+            )
+            
+            if not impl_result.success:
+                error_payload = {
                     "error_type": "agent",
                     "message": impl_result.error or "Implementer failed",
                     "recoverable": True,
-                },
-            )
-            await self.message_bus.send(error_msg)
-            return
-        
-        verify_result = await self.agent_invoker.invoke(
-            role=AgentRole.VERIFIER,
-            spec=spec,
-            tech_stack=tech_stack,
-            iteration=spec.iteration,
-        )
-        
-        if verify_result.success and self._verification_passed(verify_result):
-            complete_msg = Message(
-                from_id=spec.id,
-                to_id="orchestrator",
-                spec_id=spec.id,
-                type=MessageType.PHASE_COMPLETE,
-                payload={"phase": "implementation", "success": True},
-            )
-            await self.message_bus.send(complete_msg)
-        else:
-            error_msg = Message(
-                from_id=spec.id,
-                to_id="orchestrator",
-                spec_id=spec.id,
-                type=MessageType.ERROR_REPORT,
-                payload={
+                }
+            else:
+                verify_result = await self._verify(spec, tech_stack)
+                
+                if verify_result.success and self._verification_passed(verify_result):
+                    complete_msg = Message(
+                        from_id=spec.id,
+                        to_id="orchestrator",
+                        spec_id=spec.id,
+                        type=MessageType.PHASE_COMPLETE,
+                        payload={"phase": "implementation", "success": True},
+                    )
+                    await self.message_bus.send(complete_msg)
+                    return
+                
+                error_payload = {
                     "error_type": "test",
                     "message": "Verification failed",
                     "details": {"output": verify_result.output[:1000]},
                     "recoverable": True,
-                },
-            )
-            await self.message_bus.send(error_msg)
+                }
+            
+            if not await self._report_error(spec, error_payload):
+                return
     
     async def _deploy_integration_team(self, spec: Spec, effect: str) -> None:
-        """Deploy implementation team for integration."""
-        tech_stack = spec.get_effective_tech_stack()
-        children = self.spec_store.list_children(spec.id)
+        """
+        Deploy implementation team for integration.
         
-        impl_result = await self.agent_invoker.invoke(
-            role=AgentRole.IMPLEMENTER,
-            spec=spec,
-            tech_stack=tech_stack,
-            iteration=spec.iteration,
-            siblings=children,
-        )
+        Failed attempts are recorded and retried here until the spec passes
+        or runs out of iterations.
+        """
+        tech_stack = spec.get_effective_tech_stack()
         
-        if impl_result.success:
-            verify_result = await self.agent_invoker.invoke(
-                role=AgentRole.VERIFIER,
+        while True:
+            children = await asyncio.to_thread(self.spec_store.list_children, spec.id)
+            
+            impl_result = await self._invoke_agent(
+                role=AgentRole.IMPLEMENTER,
                 spec=spec,
                 tech_stack=tech_stack,
                 iteration=spec.iteration,
+                siblings=children,
             )
             
-            if verify_result.success and self._verification_passed(verify_result):
-                complete_msg = Message(
-                    from_id=spec.id,
-                    to_id="orchestrator",
-                    spec_id=spec.id,
-                    type=MessageType.PHASE_COMPLETE,
-                    payload={"phase": "integration", "success": True},
-                )
-                await self.message_bus.send(complete_msg)
-                return
-        
-        error_msg = Message(
-            from_id=spec.id,
-            to_id="orchestrator",
-            spec_id=spec.id,
-            type=MessageType.ERROR_REPORT,
-            payload={
+            if impl_result.success:
+                verify_result = await self._verify(spec, tech_stack)
+                
+                if verify_result.success and self._verification_passed(verify_result):
+                    complete_msg = Message(
+                        from_id=spec.id,
+                        to_id="orchestrator",
+                        spec_id=spec.id,
+                        type=MessageType.PHASE_COMPLETE,
+                        payload={"phase": "integration", "success": True},
+                    )
+                    await self.message_bus.send(complete_msg)
+                    return
+            
+            error_payload = {
                 "error_type": "integration",
                 "message": "Integration failed",
                 "recoverable": True,
-            },
+            }
+            if not await self._report_error(spec, error_payload):
+                return
+    
+    async def _verify(self, spec: Spec, tech_stack: Optional[TechStack]) -> AgentResult:
+        """Run the verifier, or pass straight away on a dry run (nothing was written)."""
+        if self.config.dry_run:
+            return AgentResult(success=True, output="[DRY RUN] Verification passed")
+        return await self._invoke_agent(
+            role=AgentRole.VERIFIER,
+            spec=spec,
+            tech_stack=tech_stack,
+            iteration=spec.iteration,
         )
-        await self.message_bus.send(error_msg)
     
     async def _create_child_specs(self, spec: Spec, effect: str) -> None:
         """Create child specs from parent's children list."""
-        children = self.spec_store.create_children(spec)
+        children = self.spec_store.create_children(spec, phase=Phase.READY)
         
         result = self.state_machine.transition(
             spec, Phase.AWAITING_CHILDREN,
@@ -761,10 +840,27 @@ class Orchestrator:
         if result.success:
             self.spec_store.save(spec)
         
-        for child in children:
-            child.phase = Phase.READY
-            self.spec_store.save(child)
-            await self._process_spec(child)
+        # Siblings are independent, so run them concurrently; _invoke_agent
+        # keeps the number of live agents within max_concurrent_agents
+        results = await asyncio.gather(
+            *(self._process_spec(child) for child in children),
+            return_exceptions=True,
+        )
+        
+        # One child crashing must not take its siblings down with it: record
+        # the failure against that child and let the rest carry on
+        for child, outcome in zip(children, results):
+            if not isinstance(outcome, BaseException):
+                continue
+            if not isinstance(outcome, Exception):
+                raise outcome
+            current = self.spec_store.get(child.id) or child
+            await self._record_error(current, {
+                "error_type": ErrorCategory.INFRASTRUCTURE.value,
+                "message": f"Processing failed: {outcome}",
+                "recoverable": False,
+            })
+            self.spec_store.save(current)
     
     async def _monitor_children(self, spec: Spec, effect: str) -> None:
         """Start monitoring children for completion."""
@@ -820,26 +916,26 @@ class Orchestrator:
         """Log spec completion."""
         log_file = self.state_dir / "completions.jsonl"
         entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
             "spec_id": spec.id,
             "spec_name": spec.name,
             "iterations": spec.iteration,
         }
         with open(log_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry) + "\n")
+            f.write(dumps(entry) + "\n")
     
     async def _log_failure(self, spec: Spec, effect: str) -> None:
         """Log spec failure."""
         log_file = self.state_dir / "failures.jsonl"
         entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_now_iso(),
             "spec_id": spec.id,
             "spec_name": spec.name,
             "iterations": spec.iteration,
             "errors": [e.to_dict() for e in spec.errors],
         }
         with open(log_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry) + "\n")
+            f.write(dumps(entry) + "\n")
     
     # =========================================================================
     # HELPERS
@@ -859,15 +955,18 @@ class Orchestrator:
     
     def _critic_approved(self, result: AgentResult) -> bool:
         """Check if critic approved the architecture."""
-        output = result.output.lower()
-        return ("approved" in output or "lgtm" in output) and "reject" not in output
+        output = result.output
+        return (
+            _CRITIC_APPROVE_RE.search(output) is not None and
+            _CRITIC_REJECT_RE.search(output) is None
+        )
     
     def _verification_passed(self, result: AgentResult) -> bool:
         """Check if verification passed."""
-        output = result.output.lower()
+        output = result.output
         return (
-            ("all tests pass" in output or "verification passed" in output) and
-            "fail" not in output and "error" not in output
+            _VERIFY_PASS_RE.search(output) is not None and
+            _VERIFY_FAIL_RE.search(output) is None
         )
 
 
@@ -5,14 +5,39 @@ Handles persistence, retrieval, and management of specs.
 Uses JSON files for human-readable, diffable storage.
 """
 
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator, Tuple, Callable, TypeVar
 from pathlib import Path
+import functools
 import json
+import os
 import shutil
+import threading
 from datetime import datetime, timezone
 
 from ..core.spec import Spec, ChildRef, create_child_spec
 from ..core.phase import Phase
+from ..core.jsonio import dumps_bytes, read_json, write_json_atomic
+
+
+T = TypeVar("T")
+
+
+def _locked(method: Callable[..., T]) -> Callable[..., T]:
+    """Run a SpecStore method while holding the store's lock."""
+    @functools.wraps(method)
+    def wrapper(self: "SpecStore", *args, **kwargs) -> T:
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _stat_matches(stamp: Tuple[int, int, int, str], stat: os.stat_result) -> bool:
+    """Check whether a file's stat still matches a recorded stamp."""
+    return (
+        stamp[0] == stat.st_mtime_ns
+        and stamp[1] == stat.st_size
+        and stamp[2] == stat.st_ino
+    )
 
 
 class SpecStore:
@@ -29,6 +54,10 @@ class SpecStore:
             └── children/
                 └── {child_name}/
                     └── spec.json
+    
+    The store may be used from worker threads (spec scans are moved off the
+    event loop), so every method that touches the in-memory caches holds
+    the store lock.
     """
     
     def __init__(self, specs_dir: Path):
@@ -41,9 +70,29 @@ class SpecStore:
         self.specs_dir = specs_dir
         self.specs_dir.mkdir(parents=True, exist_ok=True)
         
+        # Guards the dicts below; reentrant because locked methods call
+        # each other (e.g. get -> load)
+        self._lock = threading.RLock()
+        
         # In-memory cache
         self._cache: Dict[str, Spec] = {}
+        
+        # Spec name -> ID of the most recently cached spec with that name
+        self._ids_by_name: Dict[str, str] = {}
+        
+        # spec.json path -> (mtime_ns, size, inode, spec_id) as of last load/save.
+        # The inode catches atomic replaces that keep the size within the
+        # filesystem's mtime granularity.
+        self._stamps: Dict[str, Tuple[int, int, int, str]] = {}
+        
+        # spec.json path -> (content fingerprint, stamp) as of our last save
+        self._fingerprints: Dict[str, Tuple[bytes, Tuple[int, int, int, str]]] = {}
+        
+        # Bumped on every write or delete, so callers can tell when cached
+        # views of the store are out of date
+        self.generation = 0
     
+    @_locked
     def save(self, spec: Spec) -> Path:
         """
         Save a spec to disk.
@@ -60,28 +109,49 @@ class SpecStore:
         else:
             spec_dir = self.specs_dir / spec.name
         
-        spec_dir.mkdir(parents=True, exist_ok=True)
         spec.spec_dir = str(spec_dir)
+        spec_file = spec_dir / "spec.json"
+        
+        # Skip the write when nothing but the timestamp would change and the
+        # file is still exactly what we last wrote
+        data = spec.to_dict()
+        data["updated_at"] = None
+        fingerprint = dumps_bytes(data)
+        last = self._fingerprints.get(str(spec_file))
+        if last and last[0] == fingerprint and self._is_unchanged(spec_file, last[1]):
+            self._cache[spec.id] = spec
+            self._ids_by_name[spec.name] = spec.id
+            return spec_file
         
         # Update timestamp
         spec.touch()
+        data["updated_at"] = spec.updated_at
         
-        # Save to file
-        spec_file = spec_dir / "spec.json"
-        spec_file.write_text(
-            json.dumps(spec.to_dict(), indent=2),
-            encoding="utf-8"
-        )
+        # Save to file (atomically, so concurrent readers never see a partial spec)
+        try:
+            write_json_atomic(spec_file, data, indent=2)
+        except FileNotFoundError:
+            # First save into a new directory
+            spec_dir.mkdir(parents=True, exist_ok=True)
+            write_json_atomic(spec_file, data, indent=2)
         
         # Update cache
         self._cache[spec.id] = spec
+        self._ids_by_name[spec.name] = spec.id
+        self._record_stamp(spec_file, spec.id)
+        self.generation += 1
+        self._fingerprints[str(spec_file)] = (fingerprint, self._stamps[str(spec_file)])
         
         return spec_file
     
+    @_locked
     def load(self, spec_path: Path) -> Optional[Spec]:
         """
         Load a spec from disk.
         
+        If the file's mtime, size and inode match the last load or save,
+        the cached Spec is returned without re-reading the file.
+        
         Args:
             spec_path: Path to spec.json or spec directory
             
@@ -89,28 +159,41 @@ class SpecStore:
             Loaded Spec, or None if not found
         """
         # Handle both file and directory paths
-        if spec_path.is_dir():
+        if spec_path.name != "spec.json" and spec_path.is_dir():
             spec_file = spec_path / "spec.json"
         else:
             spec_file = spec_path
             spec_path = spec_file.parent
         
-        if not spec_file.exists():
+        try:
+            stat = os.stat(spec_file)
+        except FileNotFoundError:
             return None
         
+        stamp = self._stamps.get(str(spec_file))
+        if stamp and _stat_matches(stamp, stat):
+            cached = self._cache.get(stamp[3])
+            if cached is not None:
+                return cached
+        
         try:
-            data = json.loads(spec_file.read_text(encoding="utf-8"))
+            data = read_json(spec_file)
             spec = Spec.from_dict(data)
             spec.spec_dir = str(spec_path)
             
             # Update cache
             self._cache[spec.id] = spec
+            self._ids_by_name[spec.name] = spec.id
+            self._stamps[str(spec_file)] = (
+                stat.st_mtime_ns, stat.st_size, stat.st_ino, spec.id
+            )
             
             return spec
         except (json.JSONDecodeError, KeyError) as e:
             print(f"Failed to load spec from {spec_file}: {e}")
             return None
     
+    @_locked
     def get(self, spec_id: str) -> Optional[Spec]:
         """
         Get a spec by ID (from cache or disk).
@@ -126,19 +209,45 @@ class SpecStore:
             return self._cache[spec_id]
 
         # Search for spec file
-        for spec_dir in self.specs_dir.rglob("spec.json"):
-            spec = self.load(spec_dir)
+        for spec_file in self._iter_spec_files():
+            spec = self.load(spec_file)
             if spec and spec.id == spec_id:
                 return spec
 
         return None
 
+    @_locked
     def get_fresh(self, spec_id: str) -> Optional[Spec]:
-        """Get a spec by ID, bypassing cache (reads from disk)."""
-        # Clear this spec from cache first
-        self._cache.pop(spec_id, None)
-        return self.get(spec_id)  # Will now read from disk
+        """
+        Get a spec by ID, always re-reading it from disk.
+        
+        Another process (e.g. the MCP server) may have rewritten spec.json,
+        and the cached object may hold unsaved changes, so the cache is
+        bypassed. A known spec is re-read from its own directory; otherwise
+        the specs directory is searched.
+        """
+        cached = self._cache.pop(spec_id, None)
+        if cached and cached.spec_dir:
+            spec = self.load(Path(cached.spec_dir, "spec.json"))
+            if spec and spec.id == spec_id:
+                return spec
+        
+        return self.get(spec_id)
     
+    def _record_stamp(self, spec_file: Path, spec_id: str) -> None:
+        """Remember the on-disk state of a spec file we just wrote."""
+        stat = os.stat(spec_file)
+        self._stamps[str(spec_file)] = (stat.st_mtime_ns, stat.st_size, stat.st_ino, spec_id)
+    
+    def _is_unchanged(self, spec_file: Path, stamp: Tuple[int, int, int, str]) -> bool:
+        """Check whether a spec file still has the given on-disk stamp."""
+        try:
+            stat = os.stat(spec_file)
+        except FileNotFoundError:
+            return False
+        return _stat_matches(stamp, stat)
+    
+    @_locked
     def get_by_name(self, name: str) -> Optional[Spec]:
         """
         Get a spec by name.
@@ -149,17 +258,13 @@ class SpecStore:
         Returns:
             Spec if found, None otherwise
         """
-        # Check cache
-        for spec in self._cache.values():
-            if spec.name == name:
-                return spec
-        
-        # Check directory
-        spec_dir = self.specs_dir / name
-        if spec_dir.exists():
-            return self.load(spec_dir)
+        # Check cache (the index may point at an evicted or renamed spec)
+        spec = self._cache.get(self._ids_by_name.get(name, ""))
+        if spec is not None and spec.name == name:
+            return spec
         
-        return None
+        # Check directory (load returns None if there is no spec file)
+        return self.load(self.specs_dir / name / "spec.json")
     
     def list_all(self) -> List[Spec]:
         """
@@ -168,27 +273,83 @@ class SpecStore:
         Returns:
             List of all specs
         """
-        specs = []
+        return list(self.iter_all())
+    
+    def iter_all(self) -> Iterator[Spec]:
+        """
+        Yield all specs in the store, loading each one as it is reached.
         
-        for spec_file in self.specs_dir.rglob("spec.json"):
+        Use this instead of list_all when a single pass is enough.
+        """
+        for spec_file in self._iter_spec_files():
             spec = self.load(spec_file)
             if spec:
-                specs.append(spec)
+                yield spec
+    
+    def _iter_spec_files(self) -> Iterator[Path]:
+        """
+        Yield every spec.json under the specs directory.
         
-        return specs
+        Walks the tree with os.scandir, whose entries already carry the file
+        type, so finding the spec files costs one directory read per folder
+        rather than a stat per path.
+        """
+        pending = [str(self.specs_dir)]
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name == "spec.json" and entry.is_file():
+                        yield Path(entry.path)
     
     def list_by_phase(self, phase: Phase) -> List[Spec]:
         """List specs in a specific phase."""
-        return [s for s in self.list_all() if s.phase == phase]
+        return [s for s in self.iter_all() if s.phase == phase]
     
+    @_locked
     def list_children(self, parent_id: str) -> List[Spec]:
-        """List child specs of a parent."""
-        return [s for s in self.list_all() if s.parent_id == parent_id]
+        """
+        List child specs of a parent.
+        
+        Children created by create_children live under the parent's
+        children/ directory, so that directory is scanned first. If it
+        doesn't hold every child the parent lists (e.g. one was saved
+        without a spec_dir and landed at the top level), or the parent is
+        unknown, the whole tree is searched by parent_id instead.
+        """
+        parent = self._cache.get(parent_id)
+        if parent and parent.spec_dir:
+            children = []
+            try:
+                entries = os.scandir(os.path.join(parent.spec_dir, "children"))
+            except FileNotFoundError:
+                entries = None
+            
+            if entries is not None:
+                with entries:
+                    for entry in entries:
+                        if not entry.is_dir():
+                            continue
+                        spec = self.load(Path(entry.path, "spec.json"))
+                        if spec and spec.parent_id == parent_id:
+                            children.append(spec)
+            
+            expected = {c.name for c in parent.children}
+            if expected <= {c.name for c in children}:
+                return children
+        
+        return [s for s in self.iter_all() if s.parent_id == parent_id]
     
     def list_roots(self) -> List[Spec]:
         """List root specs (no parent)."""
-        return [s for s in self.list_all() if s.parent_id is None]
+        return [s for s in self.iter_all() if s.parent_id is None]
     
+    @_locked
     def delete(self, spec_id: str) -> bool:
         """
         Delete a spec and its directory.
@@ -203,21 +364,25 @@ class SpecStore:
         if not spec or not spec.spec_dir:
             return False
         
-        spec_dir = Path(spec.spec_dir)
-        if spec_dir.exists():
-            shutil.rmtree(spec_dir)
+        try:
+            shutil.rmtree(spec.spec_dir)
+        except FileNotFoundError:
+            pass
         
         # Remove from cache
         self._cache.pop(spec_id, None)
+        self.generation += 1
         
         return True
     
-    def create_children(self, parent: Spec) -> List[Spec]:
+    @_locked
+    def create_children(self, parent: Spec, phase: Phase = Phase.DRAFT) -> List[Spec]:
         """
         Create child spec directories from parent's children list.
         
         Args:
             parent: Parent spec with children defined
+            phase: Phase the children start in (saved with the first write)
             
         Returns:
             List of created child specs
@@ -225,21 +390,20 @@ class SpecStore:
         if not parent.spec_dir:
             raise ValueError("Parent spec must have spec_dir set")
         
-        parent_dir = Path(parent.spec_dir)
-        children_dir = parent_dir / "children"
-        children_dir.mkdir(exist_ok=True)
+        children_dir = Path(parent.spec_dir) / "children"
         
+        # Create all child directories up front, then write the specs
         created = []
-        
         for child_ref in parent.children:
-            # Create child spec from reference
             child_spec = create_child_spec(parent, child_ref)
+            child_spec.phase = phase
             child_spec.spec_dir = str(children_dir / child_ref.name)
-            
-            # Save child
-            self.save(child_spec)
+            os.makedirs(child_spec.spec_dir, exist_ok=True)
             created.append(child_spec)
         
+        for child_spec in created:
+            self.save(child_spec)
+        
         return created
     
     def get_siblings(self, spec: Spec) -> List[Spec]:
@@ -272,6 +436,7 @@ class SpecStore:
             return None
         return self.get(spec.parent_id)
     
+    @_locked
     def refresh_cache(self) -> None:
         """Clear cache and reload all specs."""
         self._cache.clear()
@@ -279,16 +444,20 @@ class SpecStore:
     
     def get_stats(self) -> Dict[str, any]:
         """Get statistics about stored specs."""
-        specs = self.list_all()
-        
+        total = roots = leaves = 0
         by_phase = {}
-        for spec in specs:
+        for spec in self.iter_all():
+            total += 1
             phase = spec.phase.value
             by_phase[phase] = by_phase.get(phase, 0) + 1
+            if spec.parent_id is None:
+                roots += 1
+            if spec.is_leaf is True:
+                leaves += 1
         
         return {
-            "total": len(specs),
+            "total": total,
             "by_phase": by_phase,
-            "roots": len([s for s in specs if s.parent_id is None]),
-            "leaves": len([s for s in specs if s.is_leaf is True]),
+            "roots": roots,
+            "leaves": leaves,
         }
@@ -4,8 +4,9 @@ State Machine for the Ralph pipeline.
 Manages phase transitions for specs with validation and side effects.
 """
 
-from typing import Optional, List, Dict, Callable, Awaitable
+from typing import Optional, List, Dict, Callable, Awaitable, Deque
 from dataclasses import dataclass, field
+from collections import deque
 from datetime import datetime, timezone
 
 from ..core.phase import (
@@ -15,6 +16,7 @@ from ..core.phase import (
     get_next_phase_after_approval,
 )
 from ..core.spec import Spec
+from ..core.clock import utc_now_iso
 from ..core.errors import InvalidTransitionError
 
 
@@ -30,6 +32,9 @@ class TransitionResult:
 # Type for side effect handlers
 SideEffectHandler = Callable[[Spec, str], Awaitable[None]]
 
+# Transitions kept in memory; older ones are dropped as new ones arrive
+MAX_HISTORY = 1000
+
 
 class StateMachine:
     """
@@ -38,8 +43,8 @@ class StateMachine:
     Validates transitions and triggers appropriate side effects.
     """
     
-    def __init__(self):
-        self._history: List[PhaseTransition] = []
+    def __init__(self, max_history: int = MAX_HISTORY):
+        self._history: Deque[PhaseTransition] = deque(maxlen=max_history)
         self._side_effect_handlers: Dict[str, SideEffectHandler] = {}
     
     def register_side_effect_handler(
@@ -86,19 +91,21 @@ class StateMachine:
         # Determine side effects
         side_effects = self._get_side_effects(spec, from_phase, to_phase)
         
-        # Record transition
+        # Record transition (the spec is stamped with the same time)
+        now = utc_now_iso()
         transition = PhaseTransition(
             spec_id=spec.id,
             from_phase=from_phase,
             to_phase=to_phase,
             reason=reason,
             triggered_by=triggered_by,
+            timestamp=now,
         )
         self._history.append(transition)
         
         # Update spec
         spec.phase = to_phase
-        spec.touch()
+        spec.updated_at = now
         
         return TransitionResult(
             success=True,
@@ -233,7 +240,7 @@ class StateMachine:
         )
     
     def get_history(self, spec_id: Optional[str] = None) -> List[PhaseTransition]:
-        """Get transition history, optionally filtered by spec."""
+        """Get recent transition history, optionally filtered by spec."""
         if spec_id:
             return [t for t in self._history if t.spec_id == spec_id]
         return list(self._history)
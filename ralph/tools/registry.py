@@ -15,6 +15,18 @@ from enum import Enum
 import json
 from pathlib import Path
 
+from ..config.defaults import DEFAULT_ROLE_MAX_TURNS, FORBIDDEN_TOOLS
+
+
+# Ralph MCP tools every agent gets for talking to the orchestrator
+RALPH_AGENT_TOOLS = (
+    "mcp__ralph__get_spec",
+    "mcp__ralph__get_sibling_status",
+    "mcp__ralph__send_message",
+    "mcp__ralph__report_error",
+    "mcp__ralph__update_spec",
+)
+
 
 class ToolCategory(str, Enum):
     """Categories of tools."""
@@ -271,12 +283,6 @@ ROLE_TOOL_ALLOWLIST: Dict[str, Set[str]] = {
     "editor": {"Read", "Write", "Edit", "Grep", "Glob"},
 }
 
-# Tools that are always forbidden
-FORBIDDEN_TOOLS: Set[str] = {
-    "Task",  # Don't let agents spawn sub-agents
-}
-
-
 # =============================================================================
 # TOOL REGISTRY
 # =============================================================================
@@ -436,13 +442,7 @@ class ToolRegistry:
                     }
 
         # Add Ralph communication tools for all roles
-        ralph_tools = [
-            "mcp__ralph__get_spec",
-            "mcp__ralph__get_sibling_status",
-            "mcp__ralph__send_message",
-            "mcp__ralph__report_error",
-            "mcp__ralph__update_spec",
-        ]
+        ralph_tools = list(RALPH_AGENT_TOOLS)
 
         # Add Ralph MCP server
         mcp_servers_dict["ralph"] = {
@@ -506,13 +506,7 @@ class ToolRegistry:
                     mcp_servers.append(server)
 
         # Add Ralph communication tools for all roles
-        ralph_tools = [
-            "mcp__ralph__get_spec",
-            "mcp__ralph__get_sibling_status",
-            "mcp__ralph__send_message",
-            "mcp__ralph__report_error",
-            "mcp__ralph__update_spec",
-        ]
+        ralph_tools = list(RALPH_AGENT_TOOLS)
 
         # Ralph MCP server config (will be included in agent invocations)
         ralph_server = MCPServerConfig(
@@ -522,9 +516,6 @@ class ToolRegistry:
             tools=ralph_tools,
         )
 
-        # Import defaults for max_turns fallback in legacy mode
-        from ralph.config.defaults import DEFAULT_ROLE_MAX_TURNS
-
         return {
             "allowed_tools": builtin_tools,
             "mcp_servers": {
@@ -595,12 +586,12 @@ class ToolRegistry:
         Args:
             config_path: Path to ralph.config.json
         """
-        if not config_path.exists():
+        try:
+            with open(config_path, "r", encoding="utf-8") as f:
+                config = json.load(f)
+        except FileNotFoundError:
             return
         
-        with open(config_path, "r", encoding="utf-8") as f:
-            config = json.load(f)
-        
         # Load custom MCP servers
         for server_data in config.get("mcp_servers", []):
             server = MCPServerConfig.from_dict(server_data)
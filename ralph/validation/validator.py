@@ -37,6 +37,9 @@ class Validator:
         self.schemas_dir = schemas_dir
         self._schemas: Dict[str, Dict] = {}
         
+        # Schema name -> checked validator, built on first use
+        self._compiled: Dict[str, Any] = {}
+        
         # Load built-in schemas
         self._load_builtin_schemas()
         
@@ -152,7 +155,17 @@ class Validator:
         errors = []
         
         try:
-            jsonschema.validate(data, schema)
+            validator = self._compiled.get(schema_name)
+            if validator is None:
+                # jsonschema.validate() re-checks the schema on every call;
+                # check it once and keep the validator
+                cls = jsonschema.validators.validator_for(schema)
+                cls.check_schema(schema)
+                validator = self._compiled[schema_name] = cls(schema)
+            # Report the same error jsonschema.validate() would pick
+            error = jsonschema.exceptions.best_match(validator.iter_errors(data))
+            if error is not None:
+                raise error
         except jsonschema.ValidationError as e:
             path = ".".join(str(p) for p in e.absolute_path) or "root"
             errors.append(ValidationError(path, e.message))
@@ -8,6 +8,21 @@ import tempfile
 import json
 
 
+class TestPackage:
+    """Tests for the top-level package exports."""
+
+    def test_exports_resolve_lazily(self):
+        import ralph
+        from ralph.core import Phase
+        from ralph.orchestrator import Orchestrator
+
+        assert ralph.Phase is Phase
+        assert ralph.Orchestrator is Orchestrator
+        assert set(ralph.__all__) <= set(dir(ralph))
+        with pytest.raises(AttributeError):
+            ralph.NotAnExport
+
+
 class TestPhase:
     """Tests for phase transitions."""
     
@@ -96,6 +111,119 @@ class TestMessage:
         assert msg2.type == msg.type
 
 
+class TestMessageBus:
+    """Tests for message bus persistence."""
+
+    def test_sends_are_persisted(self):
+        import asyncio
+        from ralph.core.message import Message
+        from ralph.messaging.bus import MessageBus
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_dir = Path(tmpdir) / "state"
+            bus = MessageBus(state_dir)
+
+            async def send_all():
+                for i in range(3):
+                    await bus.send(Message(from_id=f"spec-{i}", to_id="orchestrator"))
+                await bus.flush()
+
+            asyncio.run(send_all())
+            bus.send_sync(Message(from_id="sync", to_id="orchestrator"))
+
+            reloaded = MessageBus(state_dir)
+            assert len(reloaded.get_pending("orchestrator")) == 4
+
+    def test_conversation_returns_latest_messages_in_order(self):
+        from ralph.core.message import Message
+        from ralph.messaging.bus import MessageBus
+
+        bus = MessageBus()
+        for i in range(5):
+            bus.send_sync(Message(from_id=f"m{i}", to_id="orchestrator", spec_id="s1"))
+            bus.send_sync(Message(from_id=f"o{i}", to_id="orchestrator", spec_id="s2"))
+
+        conversation = bus.get_conversation("s1", limit=3)
+        assert [m.from_id for m in conversation] == ["m2", "m3", "m4"]
+
+    def test_status_changes_survive_reload(self):
+        from ralph.core.message import Message, MessageStatus
+        from ralph.messaging.bus import MessageBus
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_dir = Path(tmpdir)
+            bus = MessageBus(state_dir)
+            first = Message(from_id="a", to_id="spec-1")
+            bus.send_sync(first)
+            bus.send_sync(Message(from_id="b", to_id="spec-1"))
+            bus.deliver("spec-1")
+            bus.mark_processed(first.id)
+            bus.send_sync(Message(from_id="c", to_id="spec-1"))
+
+            reloaded = MessageBus(state_dir)
+            assert reloaded.get_message(first.id).status == MessageStatus.PROCESSED
+            assert [m.from_id for m in reloaded.get_pending("spec-1")] == ["c"]
+
+    def test_journal_is_compacted(self):
+        from ralph.core.message import Message
+        from ralph.messaging import bus as bus_module
+        from ralph.messaging.bus import MessageBus
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_dir = Path(tmpdir)
+            bus = MessageBus(state_dir)
+            msg = Message(from_id="a", to_id="spec-1")
+            bus.send_sync(msg)
+            for _ in range(bus_module.COMPACT_MIN_RECORDS):
+                bus.mark_processed(msg.id)
+
+            journal = (state_dir / "message_bus.jsonl").read_text().splitlines()
+            assert len(journal) < bus_module.COMPACT_MIN_RECORDS
+            assert MessageBus(state_dir).get_message(msg.id).status.value == "processed"
+
+    def test_bad_and_torn_records_are_skipped(self, caplog, capsys):
+        from ralph.core.message import Message
+        from ralph.messaging.bus import MessageBus
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_dir = Path(tmpdir)
+            bus = MessageBus(state_dir)
+            first = Message(from_id="a", to_id="spec-1")
+            bus.send_sync(first)
+
+            journal = state_dir / "message_bus.jsonl"
+            with open(journal, "ab") as f:
+                f.write(b'{"id": "' + first.id.encode() + b'", "status": "bogus"}\n')
+                f.write(b'{"msg": {"no": "fields"}}\n')
+                f.write(b'{"msg": {"id": "torn"')
+
+            reloaded = MessageBus(state_dir)
+            assert [m.id for m in reloaded.get_pending("spec-1")] == [first.id]
+            assert "torn last record" in caplog.text
+            assert capsys.readouterr().out == ""
+
+            # The torn tail was cut, so the next append lands on its own line
+            reloaded.send_sync(Message(from_id="b", to_id="spec-1"))
+            assert len(MessageBus(state_dir).get_pending("spec-1")) == 2
+
+    def test_legacy_state_is_migrated(self):
+        from ralph.core.message import Message
+        from ralph.messaging.bus import MessageBus
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_dir = Path(tmpdir)
+            msg = Message(from_id="a", to_id="spec-1").to_dict()
+            (state_dir / "message_bus.json").write_text(json.dumps({
+                "messages": [msg],
+                "inboxes": {"spec-1": [msg]},
+            }))
+
+            bus = MessageBus(state_dir)
+            assert bus.get_pending("spec-1")[0] is bus.get_message(msg["id"])
+            assert not (state_dir / "message_bus.json").exists()
+            assert len(MessageBus(state_dir).get_pending("spec-1")) == 1
+
+
 class TestToolRegistry:
     """Tests for tool registry."""
     
@@ -136,9 +264,162 @@ class TestToolRegistry:
         assert unity_preset.mcp_servers[0].name == "unity"
 
 
+class TestAgentRoles:
+    """Tests for role prompts."""
+
+    def test_system_prompt_reloads_on_change(self):
+        from ralph.agents.roles import AgentRole, load_system_prompt, DEFAULT_PROMPTS
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            prompts_dir = Path(tmpdir)
+            assert load_system_prompt(AgentRole.CRITIC, prompts_dir) == \
+                DEFAULT_PROMPTS[AgentRole.CRITIC]
+
+            prompt_file = prompts_dir / "critic.md"
+            prompt_file.write_text("Custom critic")
+            assert load_system_prompt(AgentRole.CRITIC, prompts_dir) == "Custom critic"
+
+            prompt_file.write_text("Edited critic prompt")
+            assert load_system_prompt(AgentRole.CRITIC, prompts_dir) == "Edited critic prompt"
+
+    def test_touched_prompt_keeps_cached_text(self, caplog):
+        import os
+        from ralph.agents.roles import AgentRole, load_system_prompt
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            prompts_dir = Path(tmpdir)
+            prompt_file = prompts_dir / "critic.md"
+            prompt_file.write_text("Stable critic")
+            first = load_system_prompt(AgentRole.CRITIC, prompts_dir)
+
+            os.utime(prompt_file, ns=(0, 0))
+            assert load_system_prompt(AgentRole.CRITIC, prompts_dir) is first
+            assert "changed on disk" not in caplog.text
+
+            prompt_file.write_text("Edited critic")
+            assert load_system_prompt(AgentRole.CRITIC, prompts_dir) == "Edited critic"
+            assert "changed on disk" in caplog.text
+
+
+class TestAgentContext:
+    """Tests for agent context building."""
+
+    def test_context_tracks_spec_changes(self):
+        from ralph.core.spec import Spec, ClassDefinition, TypeKind
+        from ralph.agents.roles import AgentRole
+        from ralph.agents.context import build_agent_context
+
+        spec = Spec(name="ctx", is_leaf=True, updated_at="2025-01-01T00:00:00.000000+00:00")
+        spec.classes = [ClassDefinition("A", TypeKind.CLASS, "A", "src/a.py")]
+        first = build_agent_context(spec, AgentRole.IMPLEMENTER)
+
+        # Changes show up without touch(), and contexts don't share section lists
+        spec.classes.append(ClassDefinition("B", TypeKind.CLASS, "B", "src/b.py"))
+        second = build_agent_context(spec, AgentRole.IMPLEMENTER)
+        assert [c["name"] for c in second.classes] == ["A", "B"]
+
+        second.classes.clear()
+        assert [c["name"] for c in first.classes] == ["A"]
+
+    def test_prompt_puts_iteration_state_last(self):
+        from ralph.core.spec import Spec
+        from ralph.agents.roles import AgentRole
+        from ralph.agents.context import build_agent_context, build_initial_prompt
+
+        spec = Spec(name="prompt", problem="Build it", success_criteria="It works")
+        first = build_initial_prompt(build_agent_context(spec, AgentRole.IMPLEMENTER))
+        retry = build_initial_prompt(
+            build_agent_context(spec, AgentRole.IMPLEMENTER, iteration=2)
+        )
+
+        prefix = first[:first.index("## Current State")]
+        assert retry.startswith(prefix)
+        assert "**Iteration:** 2/" in retry[len(prefix):]
+
+    def test_large_message_payload_is_truncated(self):
+        from ralph.core.spec import Spec
+        from ralph.core.message import Message
+        from ralph.agents.roles import AgentRole
+        from ralph.agents.context import build_agent_context, build_initial_prompt
+
+        spec = Spec(name="payload")
+        msg = Message(from_id="orchestrator", to_id=spec.id, payload={"log": "x" * 10000})
+
+        # Without a payload directory nothing is cut
+        prompt = build_initial_prompt(
+            build_agent_context(spec, AgentRole.IMPLEMENTER, pending_messages=[msg])
+        )
+        assert "x" * 10000 in prompt
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            payload_dir = Path(tmpdir) / "messages"
+            prompt = build_initial_prompt(build_agent_context(
+                spec, AgentRole.IMPLEMENTER, pending_messages=[msg], payload_dir=payload_dir,
+            ))
+
+            payload_file = payload_dir / f"{msg.id}.payload.json"
+            assert "x" * 10000 not in prompt
+            assert str(payload_file) in prompt
+            assert json.loads(payload_file.read_text()) == msg.payload
+
+    def test_verifier_prompt_is_minimal(self):
+        from ralph.core.spec import Spec
+        from ralph.agents.roles import AgentRole
+        from ralph.agents.context import build_agent_context, build_initial_prompt
+
+        spec = Spec(
+            name="verify", problem="Long background", success_criteria="It works",
+            context="Extra prose",
+        )
+        implementer = build_initial_prompt(build_agent_context(spec, AgentRole.IMPLEMENTER))
+        verifier = build_initial_prompt(build_agent_context(spec, AgentRole.VERIFIER))
+
+        assert "Long background" in implementer
+        assert "Extra prose" in implementer
+        assert "Long background" not in verifier
+        assert "Extra prose" not in verifier
+        assert "## Success Criteria" in verifier
+        assert "It works" in verifier
+        assert "## Constraints" in verifier
+
+    def test_previous_errors_are_windowed(self):
+        from ralph.core.spec import Spec
+        from ralph.core.errors import ErrorReport, ErrorCategory, ErrorSeverity
+        from ralph.agents.roles import AgentRole
+        from ralph.agents.context import build_agent_context
+
+        def report(i, message):
+            return ErrorReport(i, ErrorCategory.TEST, ErrorSeverity.ERROR, message)
+
+        errors = [report(i, f"failure {i}") for i in range(20)]
+        errors += [report(20, "Verification failed"), report(21, "Verification failed")]
+        context = build_agent_context(
+            Spec(name="errs"), AgentRole.IMPLEMENTER, previous_errors=errors
+        )
+
+        # Repeated messages are kept: their details differ between iterations
+        assert len(context.previous_errors) == 10
+        assert context.previous_errors[0]["message"] == "failure 12"
+        assert [e["iteration"] for e in context.previous_errors[-2:]] == [20, 21]
+
+
 class TestScopeEnforcement:
     """Tests for scope enforcement."""
-    
+
+    def test_context_file_is_reparsed_only_when_changed(self, monkeypatch):
+        from ralph.hooks.scope import get_agent_context_from_env
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            context_file = Path(tmpdir) / "context.json"
+            context_file.write_text(json.dumps({"allowed_paths": ["src/"]}))
+            monkeypatch.setenv("RALPH_CONTEXT_FILE", str(context_file))
+
+            first = get_agent_context_from_env()
+            assert get_agent_context_from_env() is first
+
+            context_file.write_text(json.dumps({"allowed_paths": ["src/", "tests/"]}))
+            assert get_agent_context_from_env()["allowed_paths"] == ["src/", "tests/"]
+
     def test_path_allowed(self):
         from ralph.hooks.scope import is_path_allowed
         
@@ -179,6 +460,23 @@ class TestSpecStore:
             assert loaded is not None
             assert loaded.name == "test-spec"
     
+    def test_failed_atomic_write_leaves_no_temp_file(self, monkeypatch):
+        from ralph.core import jsonio
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            target = Path(tmpdir) / "spec.json"
+            target.write_bytes(b"{}")
+
+            def failing_replace(src, dst):
+                raise OSError("disk full")
+
+            monkeypatch.setattr(jsonio.os, "replace", failing_replace)
+            with pytest.raises(OSError):
+                jsonio.write_bytes_atomic(target, b'{"new": true}')
+
+            assert [p.name for p in Path(tmpdir).iterdir()] == ["spec.json"]
+            assert target.read_bytes() == b"{}"
+    
     def test_list_by_phase(self):
         from ralph.core.spec import Spec
         from ralph.core.phase import Phase
@@ -197,6 +495,176 @@ class TestSpecStore:
             assert len(arch_specs) == 1
             assert arch_specs[0].name == "spec1"
 
+    def test_get_by_name(self):
+        from ralph.core.spec import Spec
+        from ralph.orchestrator.spec_store import SpecStore
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = SpecStore(Path(tmpdir))
+            spec = Spec(name="named")
+            store.save(spec)
+
+            assert store.get_by_name("named") is spec
+            assert store.get_by_name("missing") is None
+
+            # Falls back to the spec directory once the cache is cleared
+            store._cache.clear()
+            assert store.get_by_name("named").id == spec.id
+
+            store.delete(spec.id)
+            assert store.get_by_name("named") is None
+
+    def test_get_stats(self):
+        from ralph.core.spec import Spec
+        from ralph.core.phase import Phase
+        from ralph.orchestrator.spec_store import SpecStore
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = SpecStore(Path(tmpdir))
+            store.save(Spec(name="root", phase=Phase.DRAFT, is_leaf=False))
+            store.save(Spec(name="leaf", phase=Phase.DRAFT, is_leaf=True, parent_id="x"))
+
+            assert store.get_stats() == {
+                "total": 2,
+                "by_phase": {"draft": 2},
+                "roots": 1,
+                "leaves": 1,
+            }
+
+    def test_generation_tracks_writes(self):
+        from ralph.core.spec import Spec
+        from ralph.orchestrator.spec_store import SpecStore
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = SpecStore(Path(tmpdir))
+            spec = Spec(name="gen", problem="First")
+
+            store.save(spec)
+            assert store.generation == 1
+
+            # A save that writes nothing leaves cached views valid
+            store.save(spec)
+            assert store.generation == 1
+
+            store.delete(spec.id)
+            assert store.generation == 2
+
+    def test_save_is_atomic(self):
+        from ralph.core.spec import Spec
+        from ralph.orchestrator.spec_store import SpecStore
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = SpecStore(Path(tmpdir))
+
+            spec = Spec(name="atomic", problem="First")
+            spec_file = store.save(spec)
+            spec.problem = "Second"
+            store.save(spec)
+
+            assert json.loads(spec_file.read_text())["problem"] == "Second"
+            assert [p.name for p in spec_file.parent.iterdir()] == ["spec.json"]
+
+    def test_get_finds_nested_specs_on_disk(self):
+        from ralph.core.spec import Spec, ChildRef
+        from ralph.orchestrator.spec_store import SpecStore
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = SpecStore(Path(tmpdir))
+
+            parent = Spec(name="parent", is_leaf=False)
+            parent.children = [ChildRef(name="a", responsibility="A")]
+            store.save(parent)
+            (child,) = store.create_children(parent)
+
+            fresh = SpecStore(Path(tmpdir))
+            assert fresh.get(child.id).name == "a"
+            assert {s.name for s in fresh.list_all()} == {"parent", "a"}
+
+    def test_unchanged_save_is_skipped(self):
+        from ralph.core.spec import Spec
+        from ralph.orchestrator.spec_store import SpecStore
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = SpecStore(Path(tmpdir))
+
+            spec = Spec(name="steady", problem="Same")
+            spec_file = store.save(spec)
+            written_at = spec.updated_at
+            store.save(spec)
+            assert spec.updated_at == written_at
+
+            spec.problem = "Different"
+            store.save(spec)
+            assert json.loads(spec_file.read_text())["problem"] == "Different"
+
+    def test_list_children(self):
+        from ralph.core.spec import Spec, ChildRef
+        from ralph.orchestrator.spec_store import SpecStore
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = SpecStore(Path(tmpdir))
+
+            parent = Spec(name="parent", is_leaf=False)
+            parent.children = [
+                ChildRef(name="a", responsibility="A"),
+                ChildRef(name="b", responsibility="B"),
+            ]
+            store.save(parent)
+            store.save(Spec(name="other"))
+            store.create_children(parent)
+
+            children = store.list_children(parent.id)
+            assert sorted(c.name for c in children) == ["a", "b"]
+
+            # A child saved outside children/ is still found
+            parent.children.append(ChildRef(name="c", responsibility="C"))
+            store.save(parent)
+            store.save(Spec(name="c", parent_id=parent.id))
+            children = store.list_children(parent.id)
+            assert sorted(c.name for c in children) == ["a", "b", "c"]
+
+    def test_get_fresh_rereads_changed_file(self):
+        from ralph.core.spec import Spec
+        from ralph.orchestrator.spec_store import SpecStore
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = SpecStore(Path(tmpdir))
+
+            spec = Spec(name="fresh", problem="Original")
+            spec_file = store.save(spec)
+
+            # Unsaved in-memory changes are not what get_fresh returns
+            spec.problem = "Unsaved"
+            assert store.get_fresh(spec.id).problem == "Original"
+
+            # Simulate another process updating the file
+            data = json.loads(spec_file.read_text())
+            data["problem"] = "Updated elsewhere"
+            spec_file.write_text(json.dumps(data, indent=2))
+
+            fresh = store.get_fresh(spec.id)
+            assert fresh is not spec
+            assert fresh.problem == "Updated elsewhere"
+
+    def test_load_detects_same_size_atomic_replace(self):
+        import os
+        from ralph.core.spec import Spec
+        from ralph.orchestrator.spec_store import SpecStore
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = SpecStore(Path(tmpdir))
+            spec = Spec(name="replaced", problem="aaaa")
+            spec_file = store.save(spec)
+            stat = os.stat(spec_file)
+
+            # Same size and mtime, but a new file swapped in with os.replace
+            tmp_file = spec_file.with_suffix(".tmp")
+            tmp_file.write_text(spec_file.read_text().replace('"aaaa"', '"bbbb"'))
+            os.utime(tmp_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            os.replace(tmp_file, spec_file)
+
+            assert store.load(spec_file).problem == "bbbb"
+
 
 class TestStateMachine:
     """Tests for state machine."""
@@ -225,6 +693,273 @@ class TestStateMachine:
         assert not result.success
         assert spec.phase == Phase.DRAFT  # Unchanged
 
+    def test_history_is_bounded(self):
+        from ralph.core.spec import Spec
+        from ralph.core.phase import Phase
+        from ralph.orchestrator.state_machine import StateMachine
+
+        sm = StateMachine(max_history=2)
+        spec = Spec(name="test", phase=Phase.DRAFT)
+
+        sm.transition(spec, Phase.READY, "test")
+        sm.transition(spec, Phase.ARCHITECTURE, "test")
+        sm.transition(spec, Phase.AWAITING_ARCH_APPROVAL, "test")
+
+        history = sm.get_history(spec.id)
+        assert [t.to_phase for t in history] == [
+            Phase.ARCHITECTURE, Phase.AWAITING_ARCH_APPROVAL,
+        ]
+
+    def test_transition_stamps_spec_with_its_timestamp(self):
+        from ralph.core.spec import Spec
+        from ralph.core.phase import Phase
+        from ralph.orchestrator.state_machine import StateMachine
+
+        sm = StateMachine()
+        spec = Spec(name="test", phase=Phase.DRAFT)
+        sm.transition(spec, Phase.READY, "test")
+
+        assert sm.get_history(spec.id)[0].timestamp == spec.updated_at
+
+
+class TestOrchestrator:
+    """Tests for orchestrator helpers."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_message_bus(self):
+        """Give each test its own message bus, and drop it afterwards."""
+        from ralph.messaging.bus import reset_message_bus
+
+        reset_message_bus()
+        yield
+        reset_message_bus()
+
+    def test_status_summary_counts_phases(self):
+        from ralph.core.spec import Spec
+        from ralph.core.phase import Phase
+        from ralph.orchestrator.engine import Orchestrator
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            orch = Orchestrator(Path(tmpdir))
+            for name, phase in [("a", Phase.COMPLETE), ("b", Phase.FAILED), ("c", Phase.DRAFT)]:
+                orch.spec_store.save(Spec(name=name, phase=phase))
+
+            summary = orch.get_status_summary()
+            assert summary["status"]["specs_total"] == 3
+            assert summary["status"]["specs_complete"] == 1
+            assert summary["status"]["specs_failed"] == 1
+            assert summary["status"]["specs_blocked"] == 0
+            assert len(summary["specs"]) == 3
+
+    def test_phase_complete_message_is_dispatched(self):
+        import asyncio
+        from ralph.core.spec import Spec
+        from ralph.core.phase import Phase
+        from ralph.core.message import Message, MessageType
+        from ralph.orchestrator.engine import Orchestrator
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            orch = Orchestrator(Path(tmpdir))
+            spec = Spec(name="arch", phase=Phase.ARCHITECTURE)
+            orch.spec_store.save(spec)
+
+            asyncio.run(orch.message_bus.send(Message(
+                from_id=spec.id,
+                to_id="orchestrator",
+                spec_id=spec.id,
+                type=MessageType.PHASE_COMPLETE,
+                payload={"success": True},
+            )))
+
+            assert spec.phase == Phase.AWAITING_ARCH_APPROVAL
+
+    def test_verdict_parsing(self):
+        from ralph.agents.invoker import AgentResult
+        from ralph.orchestrator.engine import Orchestrator
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            orch = Orchestrator(Path(tmpdir))
+
+            assert orch._critic_approved(AgentResult(success=True, output="LGTM, Approved"))
+            assert not orch._critic_approved(AgentResult(success=True, output="Rejected"))
+            assert orch._verification_passed(AgentResult(success=True, output="All tests PASS"))
+            assert not orch._verification_passed(
+                AgentResult(success=True, output="All tests pass, 1 Error")
+            )
+
+    def test_agent_invocations_are_bounded(self):
+        import asyncio
+        from ralph.agents.invoker import AgentResult
+        from ralph.orchestrator.engine import Orchestrator, PipelineConfig
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            orch = Orchestrator(Path(tmpdir), config=PipelineConfig(max_concurrent_agents=2))
+            running = []
+            peak = []
+
+            async def fake_invoke(**kwargs):
+                running.append(1)
+                peak.append(len(running))
+                await asyncio.sleep(0.01)
+                running.pop()
+                return AgentResult(success=True)
+
+            orch.agent_invoker.invoke = fake_invoke
+
+            async def invoke_many():
+                await asyncio.gather(*(orch._invoke_agent() for _ in range(5)))
+
+            asyncio.run(invoke_many())
+            assert max(peak) == 2
+
+    def test_implementation_retries_until_blocked(self):
+        import asyncio
+        from ralph.core.spec import Spec
+        from ralph.core.message import MessageType
+        from ralph.core.phase import Phase
+        from ralph.agents.invoker import AgentResult
+        from ralph.orchestrator.engine import Orchestrator
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            orch = Orchestrator(Path(tmpdir))
+            spec = Spec(name="retry", phase=Phase.IMPLEMENTATION, max_iterations=3)
+            orch.spec_store.save(spec)
+
+            async def failing_invoke(**kwargs):
+                return AgentResult(success=False, error="boom")
+
+            orch.agent_invoker.invoke = failing_invoke
+            asyncio.run(orch._deploy_implementation_team(spec, "deploy"))
+
+            assert spec.phase == Phase.BLOCKED
+            assert spec.iteration == spec.max_iterations
+            assert len(spec.errors) == spec.max_iterations + 1
+
+            # Each failed attempt is still reported on the bus, but only recorded once
+            reports = [
+                m for m in orch.message_bus.get_conversation(spec.id)
+                if m.type == MessageType.ERROR_REPORT
+            ]
+            assert len(reports) == spec.max_iterations + 1
+
+    def test_agent_error_report_cannot_skip_recording(self):
+        import asyncio
+        from ralph.core.spec import Spec
+        from ralph.core.phase import Phase
+        from ralph.core.message import Message, MessageType
+        from ralph.orchestrator.engine import Orchestrator
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            orch = Orchestrator(Path(tmpdir))
+            spec = Spec(name="arch", phase=Phase.ARCHITECTURE)
+            orch.spec_store.save(spec)
+
+            asyncio.run(orch.message_bus.send(Message(
+                from_id=spec.id,
+                to_id="orchestrator",
+                spec_id=spec.id,
+                type=MessageType.ERROR_REPORT,
+                payload={"message": "boom", "recorded": True},
+            )))
+
+            assert [e.message for e in spec.errors] == ["boom"]
+
+    def test_dry_run_skips_verifier(self):
+        import asyncio
+        from ralph.core.spec import Spec
+        from ralph.core.phase import Phase
+        from ralph.orchestrator.engine import Orchestrator, PipelineConfig
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            orch = Orchestrator(Path(tmpdir), config=PipelineConfig(dry_run=True))
+            spec = Spec(name="dry", phase=Phase.IMPLEMENTATION)
+            orch.spec_store.save(spec)
+
+            roles = []
+            invoke = orch.agent_invoker.invoke
+
+            async def recording_invoke(**kwargs):
+                roles.append(kwargs["role"].value)
+                return await invoke(**kwargs)
+
+            orch.agent_invoker.invoke = recording_invoke
+            asyncio.run(orch._deploy_implementation_team(spec, "deploy"))
+
+            assert roles == ["implementer"]
+            assert spec.phase == Phase.AWAITING_IMPL_APPROVAL
+
+    def test_child_crash_is_recorded_on_that_child(self):
+        import asyncio
+        from ralph.core.spec import Spec, ChildRef
+        from ralph.core.phase import Phase
+        from ralph.orchestrator.engine import Orchestrator
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            orch = Orchestrator(Path(tmpdir))
+            parent = Spec(name="parent", is_leaf=False, phase=Phase.DECOMPOSING)
+            parent.children = [
+                ChildRef(name="a", responsibility="A"),
+                ChildRef(name="b", responsibility="B"),
+            ]
+            orch.spec_store.save(parent)
+            processed = []
+
+            async def fake_process(child):
+                child.phase = Phase.ARCHITECTURE
+                orch.spec_store.save(child)
+                if child.name == "a":
+                    raise RuntimeError("disk full")
+                processed.append(child.name)
+                return child
+
+            orch._process_spec = fake_process
+            asyncio.run(orch._create_child_specs(parent, "create"))
+
+            a, b = sorted(orch.spec_store.list_children(parent.id), key=lambda c: c.name)
+            assert processed == ["b"]
+            assert a.phase == Phase.FAILED
+            assert "disk full" in a.errors[-1].message
+            assert b.phase == Phase.ARCHITECTURE and not b.errors
+
+    def test_parent_waits_for_every_child(self):
+        import asyncio
+        from ralph.core.spec import Spec, ChildRef
+        from ralph.core.phase import Phase
+        from ralph.orchestrator.engine import Orchestrator, PipelineConfig
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            orch = Orchestrator(Path(tmpdir), config=PipelineConfig(dry_run=True))
+            parent = Spec(name="parent", is_leaf=False, phase=Phase.AWAITING_CHILDREN)
+            parent.children = [
+                ChildRef(name="a", responsibility="A"),
+                ChildRef(name="b", responsibility="B"),
+            ]
+            orch.spec_store.save(parent)
+            a, b = orch.spec_store.create_children(parent)
+
+            stray = Spec(name="b", parent_id="someone-else", phase=Phase.COMPLETE)
+            orch.spec_store.save(stray)
+            a.phase = Phase.COMPLETE
+
+            def report(child):
+                asyncio.run(orch._handle_child_complete(parent.id, {"child_id": child.id}))
+
+            # Duplicates and other parents' children don't fill the count
+            report(a)
+            report(a)
+            report(stray)
+            assert parent.phase == Phase.AWAITING_CHILDREN
+
+            # A child that left COMPLETE after reporting no longer counts
+            a.phase = Phase.IMPLEMENTATION
+            b.phase = Phase.COMPLETE
+            report(b)
+            assert parent.phase == Phase.AWAITING_CHILDREN
+
+            a.phase = Phase.COMPLETE
+            report(a)
+            assert parent.phase != Phase.AWAITING_CHILDREN
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])